@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for the protocol codec: frames decoded per second.
+Compares the table-driven codec with the old substring checks.
+"""
+
+import time
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.codec import CXACodec
+from cambridge_cxa_network.const import (
+    AMP_REPLY_PWR_ON,
+    AMP_REPLY_PWR_STANDBY,
+    AMP_REPLY_MUTE_ON,
+    AMP_REPLY_MUTE_OFF,
+    AMP_REPLY_SOURCE,
+    AMP_REPLY_FIRMWARE_VERSION,
+    NORMAL_INPUTS_AMP_REPLY_CXA81,
+)
+
+# A typical mix of replies seen while polling and switching sources
+FRAMES = [
+    "#02,01,1", "#04,01,05", "#02,03,0", "#04,01,14", "#02,01,0",
+    "#14,02,1.2.3", "#00,04", "#04,01,99", "#02,03,1", "#04,01,00",
+]
+ROUNDS = 20000
+
+
+def legacy_decode(reply):
+    """The substring checks media_player.py used before the codec."""
+    if AMP_REPLY_PWR_ON in reply:
+        return ("power", True)
+    if AMP_REPLY_PWR_STANDBY in reply:
+        return ("power", False)
+    if AMP_REPLY_MUTE_ON in reply:
+        return ("mute", True)
+    if AMP_REPLY_MUTE_OFF in reply:
+        return ("mute", False)
+    if reply.startswith(AMP_REPLY_SOURCE):
+        return ("source", NORMAL_INPUTS_AMP_REPLY_CXA81.get(reply))
+    if reply.startswith(AMP_REPLY_FIRMWARE_VERSION):
+        return ("firmware_version", reply.replace(AMP_REPLY_FIRMWARE_VERSION, ""))
+    return None
+
+
+def run(name, decode):
+    """Decode the frame mix ROUNDS times and print the rate."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for frame in FRAMES:
+            decode(frame)
+    elapsed = time.perf_counter() - start
+    count = ROUNDS * len(FRAMES)
+    print(f"{name:<8} {count / elapsed:>12,.0f} frames/s  ({elapsed * 1e9 / count:.0f} ns/frame)")
+
+
+def main():
+    codec = CXACodec("CXA81")
+    for frame in FRAMES:
+        print(f"  {frame:<14} -> {codec.decode(frame)}")
+    print()
+    run("legacy", legacy_decode)
+    run("codec", codec.decode)
+
+
+if __name__ == "__main__":
+    main()
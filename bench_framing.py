@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Benchmark for line framing: the old per-byte read_line loop against the
+LineFramer fed in bulk chunks, on synthetic bridge traffic.
+"""
+
+import time
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.framing import LineFramer
+
+# Hand-written, not captured: the replies a CXA81 gives to polling and
+# source changes, with lines ended by CR or CRLF as different firmware
+# versions do, an error reply among them.
+TRAFFIC = (
+    b"#02,01,1\r#04,01,05\r#14,02,1.2.3\r\n#02,01,1\r#04,01,14\r"
+    b"#02,03,1\r#02,03,0\r\n#04,01,00\r#00,04\r#02,01,0\r\n"
+) * 200
+# Bytes handed over per recv() when reading in bulk
+CHUNK = 64
+ROUNDS = 20
+
+
+def legacy_frames(data):
+    """The old TCPSerialConnection.read_line: one recv(1) per byte."""
+    frames = []
+    line = b''
+    for i in range(len(data)):
+        char = data[i:i + 1]  # What sock_recv(sock, 1) returned
+        if char == b'\r' or char == b'\n':
+            if line:
+                frames.append(line.decode('utf-8', errors='ignore'))
+                line = b''
+        else:
+            line += char
+    return frames
+
+
+def framer_frames(data):
+    """LineFramer fed the way sock_recv_into() fills it."""
+    framer = LineFramer()
+    frames = []
+    view = memoryview(data)
+    pos = 0
+    while pos < len(data):
+        free = framer.get_buffer()
+        count = min(len(free), CHUNK, len(data) - pos)
+        free[:count] = view[pos:pos + count]
+        framer.buffer_updated(count)
+        pos += count
+        while (frame := framer.next_frame()) is not None:
+            frames.append(frame)
+    return frames
+
+
+def run(name, split):
+    """Frame the traffic ROUNDS times and print the rate."""
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        frames = split(TRAFFIC)
+    elapsed = time.perf_counter() - start
+    count = ROUNDS * len(frames)
+    print(f"{name:<8} {count / elapsed:>12,.0f} frames/s  "
+          f"{ROUNDS * len(TRAFFIC) / elapsed / 1e6:>6.1f} MB/s")
+    return frames
+
+
+def main():
+    print(f"{len(TRAFFIC)} bytes of synthetic traffic, {CHUNK}-byte chunks")
+    print(f"recv calls per pass: legacy {len(TRAFFIC)}, "
+          f"framer {-(-len(TRAFFIC) // CHUNK)}\n")
+    legacy = run("legacy", legacy_frames)
+    framed = run("framer", framer_frames)
+    assert legacy == framed, "framers disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the TCP write path: the old executor-dispatched socket.send
+against sock_sendall with coalescing, over a local socket pair. Both go
+through the production link pacer, as every write to the amp does.
+Reports the latency of a write to an idle line, executor jobs and send
+calls, and how long a burst takes to get onto the 9600 baud line
+compared with the fixed sleeps the debug scripts use.
+"""
+
+import asyncio
+import socket
+import statistics
+import time
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.connection import TCPSerialConnection
+from cambridge_cxa_network.pacing import LinkPacer
+
+COMMAND = "#03,04,05\r"
+SEQUENTIAL = 100
+BURSTS = 5
+BURST_SIZE = 12  # Entities and automations writing to one amp at once
+FIXED_SLEEP = 0.3  # Between commands in debug_connection.py
+
+
+class LegacyWriter:
+    """The old TCPSerialConnection.write: one executor job per command, paced like the new one."""
+
+    def __init__(self, sock):
+        self.socket = sock
+        self.pacer = LinkPacer()
+        self._lock = asyncio.Lock()
+        self.sends = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def write(self, data):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            async with self._lock:
+                await self.pacer.take([data])
+                self.sends += 1
+                await asyncio.get_event_loop().run_in_executor(
+                    None, self.socket.send, data.encode('utf-8')
+                )
+        finally:
+            self.in_flight -= 1
+        return True
+
+
+class CountingConnection(TCPSerialConnection):
+    """The current connection, counting the writes that reach the socket."""
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.sends = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def write(self, data):
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            return await super().write(data)
+        finally:
+            self.in_flight -= 1
+
+    async def _write(self, data):
+        self.sends += 1
+        return await super()._write(data)
+
+
+def count_executor_jobs(loop):
+    """Count the jobs handed to loop's executors from now on."""
+    counter = {"jobs": 0}
+    run_in_executor = loop.run_in_executor
+
+    def counting(executor, func, *args):
+        counter["jobs"] += 1
+        return run_in_executor(executor, func, *args)
+
+    loop.run_in_executor = counting
+    return counter
+
+
+async def sink(sock):
+    """Read and discard everything written, like the bridge would."""
+    loop = asyncio.get_event_loop()
+    while await loop.sock_recv(sock, 65536):
+        pass
+
+
+async def measure(name, make_writer, blocking):
+    near, far = socket.socketpair()
+    near.setblocking(blocking)
+    far.setblocking(False)
+    reader = asyncio.ensure_future(sink(far))
+    writer = make_writer(near)
+    loop = asyncio.get_event_loop()
+    run_in_executor = loop.run_in_executor
+    executor = count_executor_jobs(loop)
+    # Long enough after the last write for the pacer to let the next one straight through
+    idle = 2 * writer.pacer.interval(COMMAND)
+
+    # One command at a time on an idle line, so the pacer never holds it
+    latencies = []
+    for _ in range(SEQUENTIAL):
+        await asyncio.sleep(idle)
+        start = time.perf_counter()
+        await writer.write(COMMAND)
+        latencies.append(time.perf_counter() - start)
+    sequential_sends = writer.sends
+
+    start = time.perf_counter()
+    for _ in range(BURSTS):
+        await asyncio.sleep(idle)
+        await asyncio.gather(*(writer.write(COMMAND) for _ in range(BURST_SIZE)))
+    burst_time = time.perf_counter() - start - BURSTS * idle
+    burst_sends = writer.sends - sequential_sends
+    loop.run_in_executor = run_in_executor
+
+    latencies.sort()
+    line_time = BURST_SIZE * len(COMMAND) / writer.pacer.rate
+    print(f"{name}:")
+    print(f"  idle write  mean {statistics.mean(latencies) * 1e6:7.1f} us   "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:7.1f} us")
+    print(f"  bursts      {burst_time / BURSTS * 1e3:7.1f} ms per {BURST_SIZE} commands, "
+          f"{burst_sends / BURSTS:.1f} sends per burst "
+          f"(bytes alone take {line_time * 1e3:.1f} ms at 9600 baud)")
+    print(f"  executor    {executor['jobs']} jobs, peak {writer.peak_in_flight} writes waiting")
+
+    near.close()
+    await reader
+    far.close()
+
+
+async def main():
+    def make_connection(sock):
+        connection = CountingConnection("bench", 0)
+        connection.socket = sock
+        return connection
+
+    await measure("executor socket.send (old)", LegacyWriter, True)
+    await measure("sock_sendall + coalescing", make_connection, False)
+    print(f"fixed {FIXED_SLEEP}s sleeps would take {(BURST_SIZE - 1) * FIXED_SLEEP * 1e3:.0f} ms "
+          f"per burst of {BURST_SIZE}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,22 +8,47 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.const import Platform
 
-from .const import DOMAIN
+from .const import DOMAIN, DATA_DEVICES, CONF_LINK_TERMINATOR, CONF_LINK_ECHO
+from .media_player import create_device
+from .services import async_setup_services
 
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms we support
-PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR, Platform.NUMBER, Platform.SELECT]
+PLATFORMS = [
+    Platform.MEDIA_PLAYER,
+    Platform.SENSOR,
+    Platform.NUMBER,
+    Platform.SELECT,
+    Platform.BUTTON,
+]
 
 async def async_setup(hass: HomeAssistant, config: dict):
     """Set up the Cambridge CXA Network component."""
+    await async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Cambridge CXA from a config entry."""
-    # Store config where media_player.py can access it
+    # Store config where media_player.py can access it, options taking precedence
     hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = entry.data
+    hass.data[DOMAIN][entry.entry_id] = {**entry.data, **entry.options}
+
+    # Created before the platforms, so they can all hold a reference to it
+    hass.data.setdefault(DATA_DEVICES, {})
+    device = create_device(hass, entry.entry_id, hass.data[DOMAIN][entry.entry_id])
+    hass.data[DATA_DEVICES][entry.entry_id] = device
+
+    # Learn how the bridge frames commands once and keep it in the entry.
+    # This is before the update listener is added, so it does not reload.
+    if CONF_LINK_TERMINATOR not in entry.data:
+        link = await device.async_probe_link()
+        if link is not None:
+            terminator, echo = link
+            hass.config_entries.async_update_entry(
+                entry,
+                data={**entry.data, CONF_LINK_TERMINATOR: terminator, CONF_LINK_ECHO: echo},
+            )
 
     # Tell HA to set up our media_player platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -41,6 +66,7 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     if unload_ok:
         # Remove config from memory
         hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DATA_DEVICES].pop(entry.entry_id)
 
     return unload_ok
 
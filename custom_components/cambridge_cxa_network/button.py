@@ -13,8 +13,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
-    AMP_CMD_SELECT_NEXT_SOURCE,
-    AMP_CMD_SELECT_PREV_SOURCE,
+    DATA_DEVICES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -40,6 +39,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Cambridge CXA buttons."""
     entities = []
+    device = hass.data[DATA_DEVICES][entry.entry_id]
     
     for description in BUTTON_DESCRIPTIONS:
         entities.append(
@@ -47,10 +47,11 @@ async def async_setup_entry(
                 hass,
                 entry,
                 description,
+                device,
             )
         )
     
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class CambridgeCXAButton(ButtonEntity):
@@ -61,10 +62,12 @@ class CambridgeCXAButton(ButtonEntity):
         hass: HomeAssistant,
         entry: ConfigEntry,
         description: ButtonEntityDescription,
+        device,
     ) -> None:
         """Initialize the button."""
         self._hass = hass
         self._entry = entry
+        self._device = device  # The entry's CambridgeCXADevice, called directly
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -76,24 +79,7 @@ class CambridgeCXAButton(ButtonEntity):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        # Get the media player entity
-        media_player_entity_id = f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"
-        media_player = self._hass.data.get("media_player")
-        
-        if not media_player:
-            _LOGGER.error(f"Could not find media_player platform")
-            return
-            
-        # Get all media player entities and find ours
-        for entity in media_player.entities:
-            if entity.entity_id == media_player_entity_id:
-                # Call the appropriate method on the media player entity
-                if self.entity_description.key == "next_source":
-                    await entity.async_select_next_source()
-                    _LOGGER.info("Sent next source command")
-                elif self.entity_description.key == "previous_source":
-                    await entity.async_select_prev_source()
-                    _LOGGER.info("Sent previous source command")
-                break
-        else:
-            _LOGGER.error(f"Could not find media player entity: {media_player_entity_id}")
\ No newline at end of file
+        if self.entity_description.key == "next_source":
+            await self._device.async_select_next_source()
+        elif self.entity_description.key == "previous_source":
+            await self._device.async_select_prev_source()
@@ -0,0 +1,320 @@
+"""Command-line tool for talking to a Cambridge CXA directly."""
+import argparse
+import asyncio
+import math
+import os
+import statistics
+import sys
+import time
+from typing import List, Optional, Tuple
+
+from .codec import CXACodec
+from .connection import BaseConnection, SerialConnection, TCPSerialConnection
+from .const import (
+    AMP_CMD_GET_CURRENT_SOURCE,
+    AMP_CMD_GET_FIRMWARE_VERSION,
+    AMP_CMD_GET_MUTE,
+    AMP_CMD_GET_PROTOCOL_VERSION,
+    AMP_CMD_GET_PWSTATE,
+    AMP_TYPES,
+    DEFAULT_PORT,
+    LINK_TERMINATORS,
+    PROXY_WATCH_INTERVAL,
+)
+from .controller import AmpController
+from .scanner import (
+    CommandScanner,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_SKIP,
+    RESULT_VALID,
+    candidates,
+)
+from .state import STATE_MUTED, STATE_POWER, STATE_SOURCE, STATE_SPEAKER_OUTPUT
+
+# Everything the amp can be asked, in one pipelined transaction
+STATUS_COMMANDS = [
+    AMP_CMD_GET_PWSTATE,
+    AMP_CMD_GET_MUTE,
+    AMP_CMD_GET_CURRENT_SOURCE,
+    AMP_CMD_GET_PROTOCOL_VERSION,
+    AMP_CMD_GET_FIRMWARE_VERSION,
+]
+
+# set FIELD -> the AmpState field, and whether its value is on/off
+SET_FIELDS = {
+    "power": (STATE_POWER, True),
+    "mute": (STATE_MUTED, True),
+    "source": (STATE_SOURCE, False),
+    "speaker": (STATE_SPEAKER_OUTPUT, False),
+}
+
+TERMINATORS = dict(zip(("cr", "crlf", "lf"), LINK_TERMINATORS))
+
+
+def _describe(codec: CXACodec, reply: Optional[str]) -> str:
+    """Return what a reply means, or an empty string if it is not a known reply."""
+    decoded = codec.decode(reply)
+    if decoded is None:
+        return ""
+    value = decoded.value
+    if isinstance(value, bool):
+        value = "on" if value else "off"
+    return f"{decoded.field}={value}"
+
+
+def _print_results(codec: CXACodec, commands: List[str], results: List[Tuple[Optional[str], float]]):
+    """Print every command with its reply, timing and meaning."""
+    for command, (reply, elapsed) in zip(commands, results):
+        shown = reply if reply is not None else "(no reply)"
+        print(f"{command:<12} -> {shown:<14} {elapsed * 1000:7.1f} ms  {_describe(codec, reply)}")
+
+
+def _wait_seconds(line: str) -> float:
+    """Return the pause of a "wait SECONDS" script line, or raise ValueError."""
+    words = line.split()
+    if len(words) != 2 or words[0] != "wait":
+        raise ValueError("expected wait SECONDS")
+    try:
+        seconds = float(words[1])
+    except ValueError:
+        seconds = math.nan
+    if not math.isfinite(seconds) or seconds < 0:
+        raise ValueError(f"{words[1]} is not a number of seconds")
+    return seconds
+
+
+async def _query(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Send the given commands, or the status queries, and print the replies."""
+    commands = args.commands or STATUS_COMMANDS
+    start = time.monotonic()
+    results = await connection.transaction(commands, args.timeout)
+    _print_results(codec, commands, results)
+    print(f"{len(commands)} commands in {(time.monotonic() - start) * 1000:.1f} ms")
+    return 0 if all(reply is not None for reply, _ in results) else 1
+
+
+async def _set(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Change one setting and print the amp's answer."""
+    field, on_off = SET_FIELDS[args.field]
+    value = args.value
+    if on_off:
+        if value.lower() not in ("on", "off"):
+            print(f"{args.field} must be on or off", file=sys.stderr)
+            return 2
+        value = value.lower() == "on"
+    controller = AmpController(connection, args.model)
+    try:
+        result = await controller.set(field, value)
+    except Exception as e:
+        print(f"{args.field} {args.value}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        await controller.close()
+    if not result.confirmed:
+        print(f"{args.field} {args.value}: {result.error}", file=sys.stderr)
+        return 1
+    reply = result.reply or "(no reply expected)"
+    line = f"{args.field} {args.value} -> {reply}  {result.elapsed * 1000:.1f} ms"
+    print(f"{line}  {_describe(codec, result.reply)}".rstrip())
+    return 0
+
+
+async def _watch(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Print frames the amp sends on its own until interrupted."""
+    start = time.monotonic()
+
+    def show(frame: str):
+        print(f"{time.monotonic() - start:9.3f}  {frame:<14} {_describe(codec, frame)}", flush=True)
+
+    connection.unsolicited_handler = show
+    await connection.ensure_connected()
+    if not connection.connected:
+        print("Could not connect", file=sys.stderr)
+        return 1
+    print("Watching, Ctrl-C to stop", file=sys.stderr)
+    while True:
+        await connection.flush()
+        await asyncio.sleep(PROXY_WATCH_INTERVAL)
+
+
+async def _batch(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Run a script, sending runs of consecutive commands as one pipelined transaction."""
+    source = sys.stdin if args.file == "-" else open(args.file, encoding="utf-8")
+    with source:
+        lines = [line.strip() for line in source]
+    # Checked before anything is sent, so a typo does not stop a script halfway
+    for number, line in enumerate(lines, 1):
+        if line.startswith("wait"):
+            try:
+                _wait_seconds(line)
+            except ValueError as e:
+                print(f"{args.file}:{number}: {line}: {e}", file=sys.stderr)
+                return 2
+    missing = 0
+    pending: List[str] = []
+
+    async def send():
+        nonlocal missing
+        if pending:
+            results = await connection.transaction(pending, args.timeout)
+            _print_results(codec, pending, results)
+            missing += sum(reply is None for reply, _ in results)
+            pending.clear()
+
+    for line in lines:
+        if not line or line.startswith(";"):
+            continue
+        if line.startswith("wait"):
+            await send()
+            await asyncio.sleep(_wait_seconds(line))
+            continue
+        pending.append(line)
+        if args.step:
+            await send()
+            # Leave time to look at the amp before the next command
+            await asyncio.get_event_loop().run_in_executor(None, input, "  [Enter] ")
+    await send()
+    return 0 if not missing else 1
+
+
+async def _ping(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Time power status queries, one at a time, like ping."""
+    times = []
+    for sequence in range(args.count):
+        reply, elapsed = (await connection.transaction([AMP_CMD_GET_PWSTATE], args.timeout))[0]
+        if reply is None:
+            print(f"{sequence}: no reply")
+        else:
+            times.append(elapsed * 1000)
+            print(f"{sequence}: {reply}  {elapsed * 1000:.1f} ms")
+        if sequence + 1 < args.count:
+            await asyncio.sleep(args.interval)
+    lost = args.count - len(times)
+    print(f"{args.count} sent, {lost} lost", end="")
+    if times:
+        print(
+            f", min/median/max {min(times):.1f}/{statistics.median(times):.1f}/"
+            f"{max(times):.1f} ms",
+            end="",
+        )
+    print()
+    return 0 if not lost else 1
+
+
+async def _scan(connection: BaseConnection, codec: CXACodec, args) -> int:
+    """Sweep a command space, checkpointing to the results file, and summarize it."""
+    scanner = CommandScanner(connection, args.results, args.batch, args.timeout, args.skip)
+    done = len(scanner.results)
+
+    def progress(sent: int, elapsed: float):
+        print(
+            f"\r{done + sent} scanned, {sent / elapsed:.0f} commands/s",
+            end="", file=sys.stderr, flush=True,
+        )
+
+    try:
+        summary = await scanner.run(candidates(args.groups, args.numbers, args.data), progress)
+    finally:
+        print(file=sys.stderr)
+    for command, result in scanner.results.items():
+        if result["result"] == RESULT_VALID:
+            print(f"{command:<12} -> {result['reply']:<14} {_describe(codec, result['reply'])}")
+    print(", ".join(f"{count} {result}" for result, count in sorted(summary.items())))
+    return 0
+
+
+COMMANDS = {
+    "query": _query,
+    "set": _set,
+    "watch": _watch,
+    "batch": _batch,
+    "ping": _ping,
+    "scan": _scan,
+}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the parser for the command line."""
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        epilog="The address comes from --host or --serial, or the CXA_HOST and "
+        "CXA_SERIAL environment variables.",
+    )
+    parser.add_argument("--host", default=os.environ.get("CXA_HOST"), help="USR-W610 address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="USR-W610 port")
+    parser.add_argument("--serial", default=os.environ.get("CXA_SERIAL"), help="serial port")
+    parser.add_argument("--model", choices=AMP_TYPES, default="CXA81", help="amplifier model")
+    parser.add_argument(
+        "--terminator", choices=TERMINATORS, help="line terminator the bridge needs "
+        "(default: CR, or learned with --probe)",
+    )
+    parser.add_argument(
+        "--probe", action="store_true", help="learn the terminator and echo behaviour first"
+    )
+    parser.add_argument("--timeout", type=float, help="reply deadline per command in seconds")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    query = commands.add_parser("query", help="send commands, or print the full status")
+    query.add_argument("commands", nargs="*", metavar="COMMAND", help='e.g. "#01,01"')
+
+    set_ = commands.add_parser("set", help="change a setting")
+    set_.add_argument("field", choices=SET_FIELDS)
+    set_.add_argument("value")
+
+    commands.add_parser("watch", help="print frames the amp sends on its own")
+
+    batch = commands.add_parser("batch", help="run a script of commands")
+    batch.add_argument(
+        "file", help='script of commands, "wait SECONDS" lines and ";" comments, '
+        'or "-" for standard input',
+    )
+    batch.add_argument("--step", action="store_true", help="pause after every command")
+
+    ping = commands.add_parser("ping", help="measure the round trip to the amp")
+    ping.add_argument("-c", "--count", type=int, default=10)
+    ping.add_argument("-i", "--interval", type=float, default=0.2, help="seconds between queries")
+
+    scan = commands.add_parser("scan", help="map the commands the amp understands")
+    scan.add_argument("--groups", default="1-20", help='groups to try, e.g. "1-15,20"')
+    scan.add_argument("--numbers", default="1-20", help="numbers to try in every group")
+    scan.add_argument(
+        "--data", default="", help='data values to try after every number, e.g. "0-1" or "00-15"'
+    )
+    scan.add_argument(
+        "--results", default="cxa_scan.json", help="results file, resumed if it exists"
+    )
+    scan.add_argument("--batch", type=int, default=DEFAULT_BATCH_SIZE, help="commands pipelined at once")
+    scan.add_argument(
+        "--skip", nargs="*", default=list(DEFAULT_SKIP), metavar="COMMAND",
+        help="commands never sent, with their data variants if given without data "
+        "(default: standby)",
+    )
+    return parser
+
+
+async def _run(args) -> int:
+    """Open the connection, run the command and close the connection."""
+    if args.host:
+        connection = TCPSerialConnection(args.host, args.port, idle_timeout=0)
+    else:
+        connection = SerialConnection(args.serial)
+    if args.terminator:
+        connection.configure_link(TERMINATORS[args.terminator], False)
+    try:
+        if args.probe and await connection.probe_link() is None:
+            print("Could not learn the bridge's framing, using the defaults", file=sys.stderr)
+        return await COMMANDS[args.command](connection, CXACodec(args.model), args)
+    finally:
+        await connection.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the command line tool and return its exit status."""
+    args = build_parser().parse_args(argv)
+    if not args.host and not args.serial:
+        print("Give --host or --serial, or set CXA_HOST or CXA_SERIAL", file=sys.stderr)
+        return 2
+    try:
+        return asyncio.run(_run(args))
+    except KeyboardInterrupt:
+        return 130
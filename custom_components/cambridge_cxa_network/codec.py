@@ -0,0 +1,183 @@
+"""Table-driven codec for the Cambridge CXA RS232 protocol."""
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from .const import (
+    AMP_CMD_GET_PWSTATE,
+    AMP_CMD_SET_PWR_ON,
+    AMP_CMD_SET_PWR_STANDBY,
+    AMP_CMD_GET_MUTE,
+    AMP_CMD_SET_MUTE_ON,
+    AMP_CMD_SET_MUTE_OFF,
+    AMP_CMD_GET_CURRENT_SOURCE,
+    AMP_CMD_GET_PROTOCOL_VERSION,
+    AMP_CMD_GET_FIRMWARE_VERSION,
+    AMP_REPLY_PWR_ON,
+    AMP_REPLY_PWR_STANDBY,
+    AMP_REPLY_MUTE_ON,
+    AMP_REPLY_MUTE_OFF,
+    AMP_REPLY_SOURCE,
+    AMP_REPLY_PROTOCOL_VERSION,
+    AMP_REPLY_FIRMWARE_VERSION,
+    ERROR_REPLIES,
+    NORMAL_INPUTS_CXA61,
+    NORMAL_INPUTS_CXA81,
+    NORMAL_INPUTS_AMP_REPLY_CXA61,
+    NORMAL_INPUTS_AMP_REPLY_CXA81,
+    SOUND_MODES,
+)
+
+# What a decoded reply describes
+FIELD_POWER = "power"
+FIELD_MUTE = "mute"
+FIELD_SOURCE = "source"
+FIELD_SOUND_MODE = "sound_mode"
+FIELD_PROTOCOL_VERSION = "protocol_version"
+FIELD_FIRMWARE_VERSION = "firmware_version"
+FIELD_ERROR = "error"
+
+# Upper bound on decoded lines remembered beyond the precompiled ones
+LINE_CACHE_SIZE = 256
+
+
+class Frame(NamedTuple):
+    """A parsed protocol frame."""
+
+    group: int
+    number: int
+    data: Optional[str] = None
+
+
+class Reply(NamedTuple):
+    """A decoded reply: which field it reports and the decoded value."""
+
+    field: str
+    value: Any
+    frame: Frame
+
+
+def parse_frame(line: str) -> Optional[Frame]:
+    """Parse "#GG,NN[,DATA]" into a Frame, or None if it is not a frame.
+
+    Group and number are read as integers, so "#1,25,0" and "#01,25,0"
+    parse to the same frame.
+    """
+    line = line.strip()
+    if not line.startswith("#"):
+        return None
+    parts = line[1:].split(",", 2)
+    if len(parts) < 2:
+        return None
+    try:
+        group = int(parts[0])
+        number = int(parts[1])
+    except ValueError:
+        return None
+    return Frame(group, number, parts[2] if len(parts) == 3 else None)
+
+
+def encode_frame(frame: Frame) -> str:
+    """Encode a frame in the canonical "#GG,NN[,DATA]" form."""
+    if frame.data is None:
+        return f"#{frame.group:02d},{frame.number:02d}"
+    return f"#{frame.group:02d},{frame.number:02d},{frame.data}"
+
+
+def frame_kind(line: str) -> Tuple[int, int]:
+    """Return the (group, number) of a command, reply or reply prefix such as "#04,01,"."""
+    frame = parse_frame(line.rstrip(","))
+    return frame.group, frame.number
+
+
+class CXACodec:
+    """Encode commands and decode replies for one amplifier model."""
+
+    def __init__(self, amp_type: str):
+        """Build the lookup tables for the given model."""
+        if amp_type.upper() == "CXA61":
+            inputs, input_replies = NORMAL_INPUTS_CXA61, NORMAL_INPUTS_AMP_REPLY_CXA61
+        else:
+            inputs, input_replies = NORMAL_INPUTS_CXA81, NORMAL_INPUTS_AMP_REPLY_CXA81
+
+        # (field, value) -> wire string; value None is the status query.
+        # Wire strings are taken verbatim from const.py so nothing changes
+        # on the line, including the "#1,25,x" speaker commands.
+        self._commands: Dict[Tuple[str, Any], str] = {
+            (FIELD_POWER, None): AMP_CMD_GET_PWSTATE,
+            (FIELD_POWER, True): AMP_CMD_SET_PWR_ON,
+            (FIELD_POWER, False): AMP_CMD_SET_PWR_STANDBY,
+            (FIELD_MUTE, None): AMP_CMD_GET_MUTE,
+            (FIELD_MUTE, True): AMP_CMD_SET_MUTE_ON,
+            (FIELD_MUTE, False): AMP_CMD_SET_MUTE_OFF,
+            (FIELD_SOURCE, None): AMP_CMD_GET_CURRENT_SOURCE,
+            (FIELD_PROTOCOL_VERSION, None): AMP_CMD_GET_PROTOCOL_VERSION,
+            (FIELD_FIRMWARE_VERSION, None): AMP_CMD_GET_FIRMWARE_VERSION,
+        }
+        for name, command in inputs.items():
+            self._commands[(FIELD_SOURCE, name)] = command
+        for name, command in SOUND_MODES.items():
+            self._commands[(FIELD_SOUND_MODE, name)] = command
+
+        # Replies with a fixed set of values, matched on the whole frame
+        self._exact: Dict[Frame, Tuple[str, Any]] = {
+            parse_frame(AMP_REPLY_PWR_ON): (FIELD_POWER, True),
+            parse_frame(AMP_REPLY_PWR_STANDBY): (FIELD_POWER, False),
+            parse_frame(AMP_REPLY_MUTE_ON): (FIELD_MUTE, True),
+            parse_frame(AMP_REPLY_MUTE_OFF): (FIELD_MUTE, False),
+        }
+        for reply, name in input_replies.items():
+            self._exact[parse_frame(reply)] = (FIELD_SOURCE, name)
+        for error in ERROR_REPLIES:
+            self._exact[parse_frame(error)] = (FIELD_ERROR, error)
+
+        # Replies whose data is passed through, matched on (group, number).
+        # An unknown source code decodes to None rather than being dropped.
+        self._by_kind: Dict[Tuple[int, int], str] = {
+            frame_kind(AMP_REPLY_SOURCE): FIELD_SOURCE,
+            frame_kind(AMP_REPLY_PROTOCOL_VERSION): FIELD_PROTOCOL_VERSION,
+            frame_kind(AMP_REPLY_FIRMWARE_VERSION): FIELD_FIRMWARE_VERSION,
+        }
+        for error in ERROR_REPLIES:
+            self._by_kind[frame_kind(error)] = FIELD_ERROR
+
+        # Received line -> decoded reply, precompiled for every fixed reply
+        self._lines: Dict[str, Reply] = {
+            encode_frame(frame): Reply(field, value, frame)
+            for frame, (field, value) in self._exact.items()
+        }
+        self._lines_precompiled = len(self._lines)
+
+    def encode(self, field: str, value: Any = None) -> str:
+        """Return the command that sets field to value, or queries it if value is None."""
+        try:
+            return self._commands[(field, value)]
+        except KeyError:
+            raise ValueError(f"No command for {field}={value!r}") from None
+
+    def decode_frame(self, frame: Frame) -> Optional[Reply]:
+        """Decode an already parsed frame, or return None if it is not a known reply."""
+        known = self._exact.get(frame)
+        if known is not None:
+            return Reply(known[0], known[1], frame)
+        field = self._by_kind.get((frame.group, frame.number))
+        if field is None:
+            return None
+        if field == FIELD_SOURCE:
+            return Reply(field, None, frame)
+        if field == FIELD_ERROR:
+            return Reply(field, encode_frame(Frame(frame.group, frame.number)), frame)
+        return Reply(field, frame.data, frame)
+
+    def decode(self, line: Optional[str]) -> Optional[Reply]:
+        """Decode a received line, or return None if it is not a known reply."""
+        if not line:
+            return None
+        reply = self._lines.get(line)
+        if reply is not None:
+            return reply
+        frame = parse_frame(line)
+        if frame is None:
+            return None
+        reply = self.decode_frame(frame)
+        if reply is not None and len(self._lines) < self._lines_precompiled + LINE_CACHE_SIZE:
+            self._lines[line] = reply
+        return reply
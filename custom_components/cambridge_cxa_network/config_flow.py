@@ -26,6 +26,18 @@ from .const import (
     CONF_SERIAL_PORT,
     CONF_AMP_TYPE,
     CONF_CXN_IP,
+    CONF_POLL_FAST_INTERVAL,
+    CONF_POLL_FAST_WINDOW,
+    CONF_POLL_MAX_INTERVAL,
+    CONF_POLL_STANDBY_INTERVAL,
+    CONF_JOURNAL_EXPIRY,
+    CONF_IDLE_TIMEOUT,
+    DEFAULT_POLL_FAST_INTERVAL,
+    DEFAULT_POLL_FAST_WINDOW,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_STANDBY_INTERVAL,
+    DEFAULT_JOURNAL_EXPIRY,
+    DEFAULT_IDLE_TIMEOUT,
     CONNECTION_TCP,
     CONNECTION_SERIAL,
     AMP_TYPES,
@@ -244,11 +256,40 @@ class CambridgeCXAOptionsFlow(config_entries.OptionsFlow):
             return self.async_create_entry(title="", data=user_input)
 
         # Show form with current values as defaults
-        schema = vol.Schema({
+        options = {**self.config_entry.data, **self.config_entry.options}
+        seconds = vol.All(vol.Coerce(int), vol.Range(min=1, max=3600))
+        fields = {
             vol.Optional(
                 CONF_CXN_IP,
-                default=self.config_entry.data.get(CONF_CXN_IP, "")
+                default=options.get(CONF_CXN_IP, "")
             ): str,
-        })
+            vol.Optional(
+                CONF_POLL_FAST_INTERVAL,
+                default=options.get(CONF_POLL_FAST_INTERVAL, DEFAULT_POLL_FAST_INTERVAL)
+            ): seconds,
+            vol.Optional(
+                CONF_POLL_FAST_WINDOW,
+                default=options.get(CONF_POLL_FAST_WINDOW, DEFAULT_POLL_FAST_WINDOW)
+            ): seconds,
+            vol.Optional(
+                CONF_POLL_MAX_INTERVAL,
+                default=options.get(CONF_POLL_MAX_INTERVAL, DEFAULT_POLL_MAX_INTERVAL)
+            ): seconds,
+            vol.Optional(
+                CONF_POLL_STANDBY_INTERVAL,
+                default=options.get(CONF_POLL_STANDBY_INTERVAL, DEFAULT_POLL_STANDBY_INTERVAL)
+            ): seconds,
+            vol.Optional(
+                CONF_JOURNAL_EXPIRY,
+                default=options.get(CONF_JOURNAL_EXPIRY, DEFAULT_JOURNAL_EXPIRY)
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+        }
+        if options.get(CONF_CONNECTION_TYPE) == CONNECTION_TCP:
+            # Only a network bridge has client slots to give back
+            fields[vol.Optional(
+                CONF_IDLE_TIMEOUT,
+                default=options.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT)
+            )] = vol.All(vol.Coerce(int), vol.Range(min=0, max=3600))
+        schema = vol.Schema(fields)
 
         return self.async_show_form(step_id="init", data_schema=schema)
\ No newline at end of file
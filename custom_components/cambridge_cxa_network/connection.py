@@ -0,0 +1,745 @@
+"""Connections to a Cambridge CXA amplifier over TCP (USR-W610) or serial."""
+import asyncio
+import logging
+import socket
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+import serial
+
+from .codec import parse_frame
+from .const import (
+    AMP_CMD_GET_PWSTATE,
+    AMP_CMD_SET_PWR_ON,
+    AMP_REPLY_PWR_ON,
+    COMMAND_TIMEOUTS,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_TIMEOUT,
+    DRAIN_TIMEOUT,
+    DRAIN_POLL_INTERVAL,
+    LINK_TERMINATORS,
+    POWER_ON_TIMEOUT,
+    POWER_PROBE_INTERVAL,
+    QUERY_TIMEOUT,
+    SERIAL_BAUD_RATE,
+    SERIAL_READ_TIMEOUT,
+    UNANSWERED_COMMANDS,
+)
+from .exceptions import protocol_error
+from .framing import LineFramer
+from .journal import CommandJournal
+from .pacing import LinkPacer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _is_reply(command: str, frame: str) -> bool:
+    """Return True if frame can be the amp's answer to command.
+
+    Replies come from the group after the command's group (#01 -> #02),
+    errors from group 00. Anything else is a status frame that was already
+    on its way, or a late reply to an earlier command.
+    """
+    sent = parse_frame(command)
+    received = parse_frame(frame)
+    if sent is None or received is None:
+        return True
+    return received.group in (0, sent.group + 1)
+
+
+class BaseConnection:
+    """Behaviour shared by the TCP and serial connections."""
+
+    timeout = DEFAULT_TIMEOUT
+    # Seconds without traffic after which the connection is closed, 0 = never
+    idle_timeout = 0
+
+    def __init__(self):
+        """Initialize state shared by all connections."""
+        self._lock = asyncio.Lock()
+        self._framer = LineFramer()
+        # Commands the amp rejected for good, mapped to its error reply
+        self.unsupported: Dict[str, str] = {}
+        # Called with frames that arrived outside a transaction
+        self.unsolicited_handler: Optional[Callable[[str], None]] = None
+        # Writes waiting for the lock, sent together by whoever gets it first
+        self._pending_writes: List[Tuple[str, asyncio.Future]] = []
+        # The last write, which carries on if its caller is cancelled
+        self._sending: Optional[asyncio.Future] = None
+        # Replies to commands whose transaction was cancelled, and until
+        # when they may still arrive
+        self._owed_replies = 0
+        self._owed_until = 0.0
+        # Keeps commands that could not be sent for replay, if enabled
+        self.journal: Optional[CommandJournal] = None
+        # Keeps writes within what the serial line and the amp can take
+        self.pacer = LinkPacer()
+        # What ends a command on the wire; see probe_link()
+        self.terminator = LINK_TERMINATORS[0]
+        # When the connection last carried traffic, for idle_timeout
+        self._last_used = 0.0
+
+    def command_timeout(self, command: str) -> float:
+        """Return how long after writing command its reply may take."""
+        return COMMAND_TIMEOUTS.get(command, self.timeout)
+
+    @property
+    def echo(self) -> bool:
+        """Return True if the bridge echoes commands and the echoes are dropped."""
+        return self._framer.strip_echoes
+
+    def configure_link(self, terminator: str, echo: bool):
+        """Set the line terminator the bridge needs and whether it echoes commands."""
+        self.terminator = terminator
+        self._framer.clear()
+        self._framer.strip_echoes = echo
+
+    async def probe_link(self) -> Optional[Tuple[str, bool]]:
+        """Learn the line terminator the bridge needs and whether it echoes commands.
+
+        A power status query is sent with each of LINK_TERMINATORS in turn
+        until the amp answers it. On success the connection is configured
+        and (terminator, echo) returned. Returns None, leaving the
+        connection as it was, if the amp cannot be reached or never answers.
+        """
+        terminator, echo = self.terminator, self.echo
+        async with self._lock:
+            await self.ensure_connected()
+            if not self.connected:
+                return None
+            for candidate in LINK_TERMINATORS:
+                self.configure_link(candidate, False)
+                await self._drain()
+                if not await self._send(AMP_CMD_GET_PWSTATE):
+                    break
+                # The bridge echoes at once, so an echo comes before the reply
+                echoed = False
+                deadline = time.monotonic() + QUERY_TIMEOUT
+                while (remaining := deadline - time.monotonic()) > 0:
+                    try:
+                        frame = await asyncio.wait_for(self.read_line(), remaining)
+                    except asyncio.TimeoutError:
+                        break
+                    if not frame:
+                        break
+                    if frame == AMP_CMD_GET_PWSTATE:
+                        echoed = True
+                    elif parse_frame(frame) is not None and _is_reply(AMP_CMD_GET_PWSTATE, frame):
+                        self.configure_link(candidate, echoed)
+                        _LOGGER.info(
+                            f"Bridge needs {candidate!r} after commands and "
+                            f"{'echoes' if echoed else 'does not echo'} them"
+                        )
+                        return candidate, echoed
+                    else:
+                        self._handle_unsolicited(frame)
+            self.configure_link(terminator, echo)
+        _LOGGER.warning("Could not learn how the bridge frames commands, keeping the defaults")
+        return None
+
+    def is_unsupported(self, command: str) -> bool:
+        """Return True if the amp is known to reject this command."""
+        return command in self.unsupported
+
+    async def write(self, data: str) -> bool:
+        """Write data, returning True if it was sent.
+
+        Writes that queue up while the connection is busy are coalesced:
+        the first one to get the lock sends all of them, spaced by the pacer.
+        """
+        sent = asyncio.get_event_loop().create_future()
+        entry = (data, sent)
+        self._pending_writes.append(entry)
+        try:
+            # Let writers scheduled in the same loop iteration join this batch
+            await asyncio.sleep(0)
+            async with self._lock:
+                if not sent.done():
+                    batch, self._pending_writes = self._pending_writes, []
+                    result = False
+                    try:
+                        burst = "".join(data for data, _ in batch)
+                        if await self._replay_journal(burst):
+                            await self._drain()
+                            result = await self._send(burst)
+                        if not result:
+                            self._journal(burst)
+                    finally:
+                        for _, future in batch:
+                            if not future.done():
+                                future.set_result(result)
+        finally:
+            # A caller cancelled while waiting for the lock takes its write
+            # back, so the next writer does not send it
+            if entry in self._pending_writes:
+                self._pending_writes.remove(entry)
+        return sent.result()
+
+    async def preconnect(self):
+        """Open the connection ahead of use, so the next command need not wait for it."""
+        async with self._lock:
+            await self.ensure_connected()
+            # About to be used, so not idle even if it was open already
+            self._last_used = time.monotonic()
+
+    async def flush(self):
+        """Hand any stale input to the unsolicited frame handler."""
+        async with self._lock:
+            await self._drain()
+
+    def _journal(self, data: str):
+        """Journal the commands in data that could not be sent."""
+        if self.journal is None:
+            return
+        kept = [command for command in data.split("\r") if self.journal.add(command)]
+        if kept:
+            _LOGGER.info(f"Amp not reachable, will send {', '.join(kept)} when it is back")
+
+    async def _replay_journal(self, data: str) -> bool:
+        """Send journaled commands in one burst once the amp can be reached; the caller holds the lock.
+
+        Returns False if connecting failed, so the caller need not try
+        again to send data.
+
+        data is about to be sent, so journaled commands it supersedes are
+        dropped first. The replies to the rest are read by _drain() and go
+        to the unsolicited frame handler.
+
+        A journaled power-on goes out on its own, and the rest, like data,
+        only once the amp reports it is on: commands sent while it powers up
+        are lost. If it never does, the rest stay journaled for the next try.
+        """
+        if not self.journal:
+            return True
+        for command in data.split("\r"):
+            self.journal.discard(command)
+        commands = self.journal.pending()
+        if not commands:
+            return True
+        await self.ensure_connected()
+        if not self.connected:
+            return False
+        if commands[0] == AMP_CMD_SET_PWR_ON:
+            powered_on = await self._replay_power_on()
+            if not self.connected:
+                return False
+            self.journal.discard(AMP_CMD_SET_PWR_ON)
+            if not powered_on:
+                _LOGGER.warning(f"Replayed {AMP_CMD_SET_PWR_ON} but the amp did not report power on")
+                return True
+            _LOGGER.info(f"Replayed {AMP_CMD_SET_PWR_ON} after reconnecting")
+            commands = commands[1:]
+            if not commands:
+                return True
+        if not await self._send("".join(command + "\r" for command in commands)):
+            return self.connected
+        self.journal.clear()
+        _LOGGER.info(f"Replayed {', '.join(commands)} after reconnecting")
+        now = time.monotonic()
+        self._owed_replies += len(commands)
+        self._owed_until = max(self._owed_until, *(now + self.command_timeout(c) for c in commands))
+        return True
+
+    async def _replay_power_on(self) -> bool:
+        """Send power-on and wait until the amp reports it is on; the caller holds the lock.
+
+        If the amp does not answer the power-on, its power state is queried
+        until it reports on or POWER_ON_TIMEOUT has passed. Every reply goes
+        to the unsolicited frame handler.
+        """
+        deadline = time.monotonic() + POWER_ON_TIMEOUT
+        command = AMP_CMD_SET_PWR_ON
+        await self._drain()
+        while (remaining := deadline - time.monotonic()) > 0:
+            if not await self._send(command):
+                return False
+            reply = await self._read_reply(
+                command, time.monotonic() + min(self.command_timeout(command), remaining)
+            )
+            if reply:
+                self._handle_unsolicited(reply)
+            if reply == AMP_REPLY_PWR_ON:
+                return True
+            if not self.connected:
+                return False
+            command = AMP_CMD_GET_PWSTATE
+            await asyncio.sleep(POWER_PROBE_INTERVAL)
+        return False
+
+    async def _send(self, data: str) -> bool:
+        """Write data at the pace the link allows; the caller holds the lock.
+
+        The write is shielded, so cancelling the caller never sends half a
+        command. The next _drain() waits for it to finish.
+        """
+        self._sending = asyncio.ensure_future(self._paced_write(data))
+        return await asyncio.shield(self._sending)
+
+    async def _paced_write(self, data: str) -> bool:
+        """Write CR separated commands, each once the pacer lets it go out.
+
+        On the wire each command ends with the bridge's terminator.
+        """
+        terminator = self.terminator
+        commands = [command + terminator for command in data.split("\r") if command]
+        while commands:
+            batch = await self.pacer.take(commands)
+            for command in batch:
+                self._framer.expect_echo(command[:-len(terminator)])
+            if not await self._write("".join(batch)):
+                return False
+            commands = commands[len(batch):]
+        return True
+
+    async def _drain(self):
+        """Clear stale input before a new command; the caller holds the lock.
+
+        A write or replies left behind by a cancelled transaction are waited
+        for first, up to the replies' deadlines. After that, everything
+        already received is taken without waiting. Only when a frame is
+        still half way through arriving do we wait for the rest, and never
+        longer than DRAIN_TIMEOUT. Complete frames go to the unsolicited
+        frame handler instead of being dropped.
+        """
+        try:
+            if self._sending is not None:
+                if not self._sending.done() and self._owed_replies:
+                    # The owed replies can only start once the write is done
+                    pending_since = time.monotonic()
+                    await asyncio.shield(self._sending)
+                    self._owed_until += time.monotonic() - pending_since
+                else:
+                    await asyncio.shield(self._sending)
+                self._sending = None
+            while self._owed_replies and (remaining := self._owed_until - time.monotonic()) > 0:
+                try:
+                    frame = await asyncio.wait_for(self.read_line(), remaining)
+                except asyncio.TimeoutError:
+                    break
+                if not frame:
+                    break
+                self._owed_replies -= 1
+                self._handle_unsolicited(frame)
+        except Exception as e:
+            _LOGGER.debug(f"Waiting for replies owed by a cancelled transaction failed: {e}")
+        self._owed_replies = 0
+
+        deadline = time.monotonic() + DRAIN_TIMEOUT
+        try:
+            while True:
+                while await self._read_available():
+                    pass
+                while (frame := self._framer.next_frame()) is not None:
+                    self._handle_unsolicited(frame)
+                if not len(self._framer):
+                    return
+                if time.monotonic() >= deadline:
+                    _LOGGER.debug(f"Discarding {len(self._framer)} bytes of an incomplete frame")
+                    self._framer.clear()
+                    return
+                await asyncio.sleep(DRAIN_POLL_INTERVAL)
+        except Exception as e:
+            _LOGGER.debug(f"Drain failed: {e}")
+            self._framer.clear()
+
+    def _handle_unsolicited(self, frame: str):
+        """Pass a frame nobody asked for to the handler."""
+        if self.unsolicited_handler is None:
+            _LOGGER.debug(f"Ignoring unsolicited frame {frame}")
+            return
+        try:
+            self.unsolicited_handler(frame)
+        except Exception:
+            _LOGGER.exception(f"Error handling unsolicited frame {frame}")
+
+    async def _read_reply(self, command: str, deadline: float) -> Optional[str]:
+        """Read the reply to command, or return None if it is not in by deadline.
+
+        Frames that cannot be its reply go to the unsolicited frame handler.
+        """
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                frame = await asyncio.wait_for(self.read_line(), remaining)
+            except asyncio.TimeoutError:
+                return None
+            if not frame:
+                return None
+            if _is_reply(command, frame):
+                return frame
+            self._handle_unsolicited(frame)
+        return None
+
+    async def transaction(
+        self, commands: List[str], timeout: Optional[float] = None
+    ) -> List[Tuple[Optional[str], float]]:
+        """Send commands pipelined under the lock and read one reply per command.
+
+        Returns (reply, seconds since the write) for every command, with
+        None as the reply when the amp did not answer by the command's
+        deadline: timeout after the write if given, else command_timeout().
+        Commands the amp is known to reject are not sent; they get the
+        error reply it gave last time straight away. Commands it never
+        answers, see UNANSWERED_COMMANDS, are sent and get None.
+
+        If the caller is cancelled, replies still owed are read and handed
+        to the unsolicited frame handler before the next command is sent,
+        so they are never taken for that command's reply.
+        """
+        # Unsent commands answer with their cached error, or None
+        results = [(self.unsupported.get(command), 0.0) for command in commands]
+        to_send = [i for i, command in enumerate(commands) if command not in self.unsupported]
+        async with self._lock:
+            reachable = await self._replay_journal("\r".join(commands[i] for i in to_send))
+            await self._drain()
+            start = time.monotonic()
+            data = "".join(commands[i] + "\r" for i in to_send)
+            # The amp carries some commands out without answering, so no
+            # reply is read for them
+            to_send = [i for i in to_send if commands[i] not in UNANSWERED_COMMANDS]
+            deadlines = {}
+            # A late reply may be taken for the next command's, so after a
+            # missed deadline error replies no longer mark commands unsupported
+            in_step = True
+            try:
+                if data and not (reachable and await self._send(data)):
+                    self._journal(data)
+                    to_send = []
+                # Deadlines run from when the last command was written, after pacing
+                sent = time.monotonic()
+                deadlines = {
+                    i: sent + (timeout or self.command_timeout(commands[i])) for i in to_send
+                }
+                while to_send:
+                    i = to_send[0]
+                    reply = await self._read_reply(commands[i], deadlines[i])
+                    to_send.pop(0)
+                    if reply is None:
+                        in_step = False
+                    error = protocol_error(commands[i], reply)
+                    if error is not None and error.permanent and in_step:
+                        _LOGGER.info(f"{commands[i]} is not supported by this amp, it will not be sent again")
+                        self.unsupported[commands[i]] = error.reply
+                    results[i] = (reply, time.monotonic() - start)
+            finally:
+                if to_send:
+                    # Cancelled while writing, the write carries on, or while reading
+                    self._owed_replies += len(to_send)
+                    self._owed_until = max(
+                        self._owed_until,
+                        *(deadlines.get(i, time.monotonic() + self.command_timeout(commands[i]))
+                          for i in to_send),
+                    )
+        return results
+
+    async def query(self, command: str, timeout: Optional[float] = None) -> Optional[str]:
+        """Send one command and return its reply, raising CXAProtocolError on an error frame."""
+        if command in self.unsupported:
+            raise protocol_error(command, self.unsupported[command])
+        reply, _ = (await self.transaction([command], timeout))[0]
+        error = protocol_error(command, reply)
+        if error is not None:
+            raise error
+        return reply
+
+
+class TCPSerialConnection(BaseConnection):
+    """TCP connection wrapper that mimics serial interface."""
+
+    def __init__(self, host: str, port: int, idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        """Initialize TCP connection parameters."""
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.timeout = DEFAULT_TIMEOUT
+        self.idle_timeout = idle_timeout
+        self.socket = None
+        # Closes the socket once idle
+        self._idle_handle: Optional[asyncio.TimerHandle] = None
+        # How often the socket was opened, how long the last open took,
+        # and how long the bridge slot was held until the last close
+        self.connects = 0
+        self.connect_latency: Optional[float] = None
+        self.last_hold: Optional[float] = None
+        self._opened = 0.0
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the TCP connection is open."""
+        return self.socket is not None
+
+    async def connect(self):
+        """Establish TCP connection to USR-W610."""
+        try:
+            start = time.monotonic()
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.settimeout(self.timeout)
+            await asyncio.get_event_loop().run_in_executor(
+                None, self.socket.connect, (self.host, self.port)
+            )
+            # All I/O from here on is through the event loop
+            self.socket.setblocking(False)
+            self._framer.clear()
+            self._opened = self._last_used = time.monotonic()
+            self.connects += 1
+            self.connect_latency = self._opened - start
+            self._arm_idle_timer(self.idle_timeout)
+            _LOGGER.info(
+                f"Connected to CXA via TCP at {self.host}:{self.port} "
+                f"in {self.connect_latency * 1000:.0f} ms"
+            )
+        except Exception as e:
+            _LOGGER.error(f"Failed to connect to {self.host}:{self.port}: {e}")
+            self.socket = None
+
+    def _arm_idle_timer(self, delay: float):
+        """Check for idleness after delay seconds, if the connection is ever released."""
+        if self.idle_timeout:
+            self._idle_handle = asyncio.get_event_loop().call_later(delay, self._release_if_idle)
+
+    def _release_if_idle(self):
+        """Close the socket if it has not been used for idle_timeout, else check again later."""
+        self._idle_handle = None
+        if not self.socket:
+            return
+        idle_for = time.monotonic() - self._last_used
+        if self._lock.locked() or idle_for < self.idle_timeout:
+            self._arm_idle_timer(max(self.idle_timeout - idle_for, DRAIN_TIMEOUT))
+            return
+        _LOGGER.debug(f"Releasing the bridge connection after {idle_for:.0f} s without traffic")
+        self._disconnected()
+
+    def _disconnected(self):
+        """Close the socket and record how long the bridge slot was held."""
+        if self._idle_handle is not None:
+            self._idle_handle.cancel()
+            self._idle_handle = None
+        if self.socket:
+            self.socket.close()
+            self.socket = None
+            self.last_hold = time.monotonic() - self._opened
+
+    async def ensure_connected(self):
+        """Ensure we have an active connection."""
+        if not self.socket:
+            await self.connect()
+
+    async def _write(self, data: str) -> bool:
+        """Write data to TCP socket; the caller holds the lock."""
+        await self.ensure_connected()
+        if not self.socket:
+            return False
+
+        try:
+            # sock_sendall stays on the event loop and retries partial sends
+            await asyncio.get_event_loop().sock_sendall(self.socket, data.encode('utf-8'))
+            self._last_used = time.monotonic()
+            _LOGGER.debug(f"Sent: {data.strip()}")
+            return True
+        except Exception as e:
+            _LOGGER.error(f"Write failed: {e}")
+            self._disconnected()
+            return False
+
+    async def read_line(self) -> str:
+        """Read a line from TCP socket."""
+        if not self.socket:
+            return ""
+
+        try:
+            loop = asyncio.get_event_loop()
+
+            # Read whatever has arrived straight into the framer until it
+            # holds a complete line
+            while (frame := self._framer.next_frame()) is None:
+                received = await loop.sock_recv_into(self.socket, self._framer.get_buffer())
+                if not received:
+                    raise ConnectionError("connection closed by bridge")
+                self._framer.buffer_updated(received)
+
+            self._last_used = time.monotonic()
+            _LOGGER.debug(f"Received: {frame}")
+            return frame
+        except Exception as e:
+            _LOGGER.error(f"Read failed: {e}")
+            self._disconnected()
+            return ""
+
+    async def _read_available(self) -> int:
+        """Move bytes the socket already holds into the framer, without waiting."""
+        if not self.socket:
+            return 0
+        try:
+            received = self.socket.recv_into(self._framer.get_buffer())
+        except BlockingIOError:
+            return 0
+        except OSError:
+            self._disconnected()
+            raise
+        if not received:
+            self._disconnected()
+            raise ConnectionError("connection closed by bridge")
+        self._framer.buffer_updated(received)
+        return received
+
+    async def close(self):
+        """Close TCP connection."""
+        if self.socket:
+            self._disconnected()
+            _LOGGER.info("TCP connection closed")
+
+
+class SerialConnection(BaseConnection):
+    """Serial connection wrapper for direct USB/RS232.
+
+    pyserial only offers blocking calls. They all run on one thread owned
+    by this connection, which opens, uses and closes the port, so a slow
+    read never ties up the shared executor other integrations depend on.
+    """
+
+    def __init__(self, device: str):
+        """Initialize serial connection parameters."""
+        super().__init__()
+        self.device = device
+        self.serial = None
+        self._executor = None
+        # Calls submitted to the I/O thread that have not finished yet, and
+        # the most there were since take_peak_queue_depth() was last called
+        self.queue_depth = 0
+        self._peak_queue_depth = 0
+        # A read whose caller was cancelled; its bytes go to the next reader
+        self._read_job: Optional[asyncio.Future] = None
+
+    def _submit(self, func, *args) -> asyncio.Future:
+        """Queue a blocking pyserial call on this port's own I/O thread."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"cxa_serial_{self.device}"
+            )
+        self.queue_depth += 1
+        self._peak_queue_depth = max(self._peak_queue_depth, self.queue_depth)
+        job = asyncio.get_event_loop().run_in_executor(self._executor, func, *args)
+        job.add_done_callback(self._job_done)
+        return job
+
+    def _job_done(self, job: asyncio.Future):
+        """Count a finished I/O thread call."""
+        self.queue_depth -= 1
+
+    def take_peak_queue_depth(self) -> int:
+        """Return the largest queue_depth since the last call, and start over from the current one."""
+        peak = self._peak_queue_depth
+        self._peak_queue_depth = self.queue_depth
+        return peak
+
+    async def _run(self, func, *args):
+        """Run a blocking pyserial call on this port's own I/O thread."""
+        return await self._submit(func, *args)
+
+    async def _read_job_result(self) -> bytes:
+        """Wait for the pending read, starting one if there is none.
+
+        The read is shielded: if the caller is cancelled it carries on, and
+        whoever reads next gets its bytes, so no part of a reply is lost.
+        """
+        if self._read_job is None:
+            self._read_job = self._submit(self._read_chunk)
+        try:
+            return await asyncio.shield(self._read_job)
+        finally:
+            if self._read_job.done():
+                self._read_job = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the serial port is open."""
+        return self.serial is not None and self.serial.is_open
+
+    async def connect(self):
+        """Open serial port with Cambridge parameters."""
+        try:
+            self.serial = await self._run(
+                serial.Serial,
+                self.device,
+                SERIAL_BAUD_RATE,
+                serial.EIGHTBITS,
+                serial.PARITY_NONE,
+                serial.STOPBITS_ONE,
+                SERIAL_READ_TIMEOUT
+            )
+            self._read_job = None
+            self._framer.clear()
+            _LOGGER.info(f"Connected to CXA on {self.device}")
+        except Exception as e:
+            _LOGGER.error(f"Failed to open serial port {self.device}: {e}")
+            self.serial = None
+
+    async def ensure_connected(self):
+        """Ensure serial port is open."""
+        if not self.serial or not self.serial.is_open:
+            await self.connect()
+
+    async def _write(self, data: str) -> bool:
+        """Write data to serial port; the caller holds the lock."""
+        await self.ensure_connected()
+        if not self.serial:
+            return False
+
+        try:
+            await self._run(self.serial.write, data.encode('utf-8'))
+            _LOGGER.debug(f"Serial sent: {data.strip()}")
+            return True
+        except Exception as e:
+            _LOGGER.error(f"Serial write failed: {e}")
+            self.serial = None
+            return False
+
+    async def read_line(self) -> str:
+        """Read a line from serial port."""
+        if not self.serial:
+            return ""
+
+        try:
+            # Reads time out after SERIAL_READ_TIMEOUT with nothing; keep
+            # going until the caller's deadline cancels us
+            while (frame := self._framer.next_frame()) is None:
+                self._framer.feed(await self._read_job_result())
+
+            _LOGGER.debug(f"Serial received: {frame}")
+            return frame
+        except Exception as e:
+            _LOGGER.error(f"Serial read failed: {e}")
+            return ""
+
+    def _read_chunk(self) -> bytes:
+        """Block for the first byte, then take everything else that has arrived."""
+        data = self.serial.read(1)
+        if data and self.serial.in_waiting:
+            data += self.serial.read(self.serial.in_waiting)
+        return data
+
+    def _read_waiting(self) -> bytes:
+        """Return the bytes the port already holds, without blocking."""
+        waiting = self.serial.in_waiting
+        return self.serial.read(waiting) if waiting else b""
+
+    async def _read_available(self) -> int:
+        """Move bytes the port already holds into the framer, without waiting."""
+        if not self.serial:
+            return 0
+        if self._read_job is not None:
+            # Left over from a cancelled read; the I/O thread is busy with it
+            data = await self._read_job_result()
+        else:
+            data = await self._run(self._read_waiting)
+        self._framer.feed(data)
+        return len(data)
+
+    async def close(self):
+        """Close serial port and stop its I/O thread."""
+        if self.serial:
+            await self._run(self.serial.close)
+            self.serial = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
@@ -6,7 +6,50 @@ DEFAULT_NAME = "Cambridge Audio CXA"
 # Network defaults - USR-W610 typically uses port 8899
 DEFAULT_PORT = 8899
 DEFAULT_SERIAL_PORT = "/dev/ttyUSB0"
+# The amp's RS232 line: 9600 baud 8N1 is ten bits, so 960 bytes, a second
+SERIAL_BAUD_RATE = 9600
+LINK_BYTES_PER_SECOND = SERIAL_BAUD_RATE / 10
+# The time the amp needs between two commands (seconds)
+AMP_COMMAND_GAP = 0.02
+# Connect timeout, and the reply deadline for commands without one of their own
 DEFAULT_TIMEOUT = 2.0
+# Reply deadline for status queries, which the amp answers at once
+QUERY_TIMEOUT = 1.0
+# Reply deadline for power on, which the amp only answers once it is up
+POWER_ON_COMMAND_TIMEOUT = 5.0
+# How long one blocking serial read waits; reply deadlines are enforced above it
+SERIAL_READ_TIMEOUT = 0.1
+# Timeout for the status query that verifies an unconfirmed command
+VERIFY_TIMEOUT = 0.5
+# Upper bound on waiting for a half received stale frame before a new command
+DRAIN_TIMEOUT = 0.1
+DRAIN_POLL_INTERVAL = 0.005
+# How long commands are held while the amp powers up, and how often it is probed
+POWER_ON_TIMEOUT = 10.0
+POWER_PROBE_INTERVAL = 0.25
+# Status polling: fast for a while after a command or change, then backing
+# off to the maximum; in standby only power is polled (seconds)
+DEFAULT_POLL_FAST_INTERVAL = 2
+DEFAULT_POLL_FAST_WINDOW = 30
+DEFAULT_POLL_MAX_INTERVAL = 300
+DEFAULT_POLL_STANDBY_INTERVAL = 60
+# How long commands that could not be sent are kept for replay (seconds, 0 = off)
+DEFAULT_JOURNAL_EXPIRY = 30
+# How long an unused TCP connection holds one of the bridge's few client
+# slots before it is closed (seconds, 0 = never), and how long before a
+# scheduled poll it is opened again
+DEFAULT_IDLE_TIMEOUT = 30
+PRECONNECT_LEAD = 1.0
+# Local port the connection sharing proxy listens on, and how often it
+# looks for frames the amp sends on its own while no client is talking
+DEFAULT_PROXY_PORT = 8898
+PROXY_WATCH_INTERVAL = 0.1
+# Local port of the standalone daemon's JSON-lines API, and how many
+# messages may wait for a client before it is dropped as not reading
+DEFAULT_DAEMON_PORT = 8897
+DAEMON_CLIENT_BACKLOG = 256
+# Line terminators a bridge may need, tried in this order when probing it
+LINK_TERMINATORS = ["\r", "\r\n", "\n"]
 
 # Configuration keys
 CONF_CONNECTION_TYPE = "connection_type"
@@ -15,6 +58,15 @@ CONF_TCP_PORT = "tcp_port"
 CONF_SERIAL_PORT = "serial_port"
 CONF_AMP_TYPE = "amp_type"
 CONF_CXN_IP = "cxn_ip"
+CONF_POLL_FAST_INTERVAL = "poll_fast_interval"
+CONF_POLL_FAST_WINDOW = "poll_fast_window"
+CONF_POLL_MAX_INTERVAL = "poll_max_interval"
+CONF_POLL_STANDBY_INTERVAL = "poll_standby_interval"
+CONF_JOURNAL_EXPIRY = "journal_expiry"
+CONF_IDLE_TIMEOUT = "idle_timeout"
+# Learned from the bridge once and kept in the config entry
+CONF_LINK_TERMINATOR = "link_terminator"
+CONF_LINK_ECHO = "link_echo"
 
 CONNECTION_TCP = "tcp"
 CONNECTION_SERIAL = "serial"
@@ -43,6 +95,16 @@ AMP_CMD_SET_SOURCE = "#03,04,"          # Set source XX -> #04,01,XX (official p
 AMP_CMD_GET_PROTOCOL_VERSION = "#13,01" # Get protocol version
 AMP_CMD_GET_FIRMWARE_VERSION = "#13,02" # Get firmware version
 
+# Reply deadline per command, measured from when it was written
+COMMAND_TIMEOUTS = {
+    AMP_CMD_GET_PWSTATE: QUERY_TIMEOUT,
+    AMP_CMD_GET_MUTE: QUERY_TIMEOUT,
+    AMP_CMD_GET_CURRENT_SOURCE: QUERY_TIMEOUT,
+    AMP_CMD_GET_PROTOCOL_VERSION: QUERY_TIMEOUT,
+    AMP_CMD_GET_FIRMWARE_VERSION: QUERY_TIMEOUT,
+    AMP_CMD_SET_PWR_ON: POWER_ON_COMMAND_TIMEOUT,
+}
+
 # Reply codes - OFFICIAL PROTOCOL RESPONSES  
 AMP_REPLY_PWR_STANDBY = "#02,01,0"     # Power is off/standby
 AMP_REPLY_PWR_ON = "#02,01,1"          # Power is on
@@ -57,6 +119,12 @@ ERROR_CMD_GROUP_UNKNOWN = "#00,01"
 ERROR_CMD_NUMBER_UNKNOWN = "#00,02"
 ERROR_CMD_DATA_ERROR = "#00,03"
 ERROR_CMD_NOT_AVAILABLE = "#00,04"
+ERROR_REPLIES = (
+    ERROR_CMD_GROUP_UNKNOWN,
+    ERROR_CMD_NUMBER_UNKNOWN,
+    ERROR_CMD_DATA_ERROR,
+    ERROR_CMD_NOT_AVAILABLE,
+)
 
 # Input sources for CXA61 - Using #03,02,XX pattern
 NORMAL_INPUTS_CXA61 = {
@@ -119,4 +187,54 @@ SOUND_MODES = {
     "A": "#1,25,0",
     "AB": "#1,25,1",
     "B": "#1,25,2"
-}
\ No newline at end of file
+}
+
+# Commands the amp carries out without sending a reply
+UNANSWERED_COMMANDS = frozenset(SOUND_MODES.values())
+
+# hass.data key of the CambridgeCXADevice for each config entry, so every
+# platform can call it directly
+DATA_DEVICES = f"{DOMAIN}_devices"
+
+# Dispatcher signals, formatted with the config entry id. The media player
+# sends its state and attributes with SIGNAL_STATE_UPDATED whenever it
+# writes them, and again on SIGNAL_REQUEST_STATE, which entities send when
+# they are added. Only the diagnostic sensors use them; entities showing
+# the amp's state subscribe to the device's AmpState fields instead.
+SIGNAL_STATE_UPDATED = f"{DOMAIN}_state_updated_{{}}"
+SIGNAL_REQUEST_STATE = f"{DOMAIN}_request_state_{{}}"
+
+# Services
+SERVICE_GROUP_COMMAND = "group_command"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_SEND_RAW = "send_raw"
+SERVICE_PRECONNECT = "preconnect"
+
+ATTR_ACTION = "action"
+ATTR_OPTION = "option"
+ATTR_PERSIST = "persist"
+ATTR_COMMANDS = "commands"
+# What a raw protocol command must look like, e.g. "#01,01" or "#1,25,0"
+RAW_COMMAND_PATTERN = r"^#[0-9]+(,[0-9]+)*$"
+
+# Persistent storage for snapshots
+SNAPSHOT_STORAGE_KEY = f"{DOMAIN}.snapshots"
+SNAPSHOT_STORAGE_VERSION = 1
+
+# Actions accepted by the group_command service
+GROUP_ACTION_TURN_ON = "turn_on"
+GROUP_ACTION_TURN_OFF = "turn_off"
+GROUP_ACTION_MUTE = "mute"
+GROUP_ACTION_UNMUTE = "unmute"
+GROUP_ACTION_SELECT_SOURCE = "select_source"
+GROUP_ACTION_SELECT_SOUND_MODE = "select_sound_mode"
+
+GROUP_ACTIONS = [
+    GROUP_ACTION_TURN_ON,
+    GROUP_ACTION_TURN_OFF,
+    GROUP_ACTION_MUTE,
+    GROUP_ACTION_UNMUTE,
+    GROUP_ACTION_SELECT_SOURCE,
+    GROUP_ACTION_SELECT_SOUND_MODE,
+]
@@ -0,0 +1,441 @@
+"""The amp's behaviour, shared by the media player and the standalone daemon."""
+import asyncio
+import logging
+import time
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .codec import (
+    CXACodec,
+    FIELD_FIRMWARE_VERSION,
+    FIELD_MUTE,
+    FIELD_POWER,
+    FIELD_SOUND_MODE,
+    FIELD_SOURCE,
+    Reply,
+)
+from .connection import BaseConnection
+from .const import (
+    NORMAL_INPUTS_CXA61,
+    NORMAL_INPUTS_CXA81,
+    POWER_ON_TIMEOUT,
+    POWER_PROBE_INTERVAL,
+    PRECONNECT_LEAD,
+    SOUND_MODES,
+    VERIFY_TIMEOUT,
+)
+from .exceptions import CXAProtocolError
+from .scheduler import PollScheduler
+from .state import (
+    AmpState,
+    AmpStateTracker,
+    STATE_MUTED,
+    STATE_POWER,
+    STATE_SOURCE,
+    STATE_SPEAKER_OUTPUT,
+    status_changes,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class PowerGate:
+    """Hold commands that need a running amp until a power-on has completed.
+
+    The gate is open in normal operation. Sending power-on closes it and any
+    status reply saying the amp is on opens it again, releasing the waiting
+    commands in the order they arrived.
+    """
+
+    def __init__(self):
+        """Initialize an open gate."""
+        self._ready = asyncio.Event()
+        self._ready.set()
+
+    @property
+    def is_ready(self) -> bool:
+        """Return True if commands can be sent right away."""
+        return self._ready.is_set()
+
+    def close(self):
+        """Hold dependent commands until the amp reports it is on."""
+        self._ready.clear()
+
+    def open(self):
+        """Release all held commands."""
+        self._ready.set()
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the gate to open, returning False on timeout."""
+        if self._ready.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+class CommandResult(NamedTuple):
+    """How a command that changes a setting went."""
+
+    # The amp confirmed it; for a command it never answers, it was sent
+    confirmed: bool
+    reply: Optional[str] = None
+    elapsed: float = 0.0
+    # Why it was not confirmed, if the amp or the connection said why
+    error: Optional[str] = None
+    # Waiting in the journal to be sent once the amp can be reached
+    journaled: bool = False
+
+
+class AmpController:
+    """Keep the state of one amp current and change it."""
+
+    def __init__(
+        self,
+        connection: BaseConnection,
+        amp_type: str,
+        scheduler: Optional[PollScheduler] = None,
+        name: Optional[str] = None,
+    ):
+        """Initialize with nothing known about the amp yet, so the first refresh asks for everything.
+
+        name is how the amp is called in log messages, by default its model.
+        """
+        self.connection = connection
+        self.amp_type = amp_type.upper()
+        self.name = name or self.amp_type
+        self.codec = CXACodec(self.amp_type)
+        self.sources = NORMAL_INPUTS_CXA61 if self.amp_type == "CXA61" else NORMAL_INPUTS_CXA81
+        self.amp = AmpStateTracker(AmpState())
+        self.scheduler = scheduler or PollScheduler()
+        self.power_gate = PowerGate()
+        self._probe_task: Optional[asyncio.Task] = None
+        # Set to cut the wait for the next poll short, see run()
+        self._wake = asyncio.Event()
+        # Called when activity interrupts slow polling, for callers that
+        # schedule polls themselves instead of using run()
+        self.wake_handler: Optional[Callable[[], None]] = None
+        connection.unsolicited_handler = self.handle_frame
+        self.amp.subscribe(
+            self._on_change, (STATE_POWER, STATE_SOURCE, STATE_MUTED, STATE_SPEAKER_OUTPUT)
+        )
+
+    @property
+    def state(self) -> AmpState:
+        """Return the cached amp state."""
+        return self.amp.state
+
+    def apply_reply(self, reply: Optional[Reply]) -> bool:
+        """Update the state from a decoded status reply, returning True if it was one."""
+        changes = status_changes(reply)
+        if changes is None:
+            return False
+        if reply.field == FIELD_SOURCE and reply.value is None:
+            _LOGGER.debug(f"Unknown source code in {reply.frame}")
+        self.amp.update(**changes)
+        if changes.get(STATE_POWER):
+            self.power_gate.open()
+        return True
+
+    def handle_frame(self, frame: Optional[str]) -> bool:
+        """Apply a status frame that arrived outside a transaction, such as a late reply."""
+        return self.apply_reply(self.codec.decode(frame))
+
+    def _on_change(self, state: AmpState, changed):
+        """Poll fast for a while when the amp's settings change."""
+        self.mark_activity()
+
+    def mark_activity(self):
+        """Poll fast for a while, after a command or an unprompted change."""
+        slow = not self.scheduler.is_fast
+        self.scheduler.activity()
+        if slow:
+            self._wake.set()
+            if self.wake_handler is not None:
+                self.wake_handler()
+
+    def next_interval(self) -> float:
+        """Return the delay until the next poll after one has completed."""
+        return self.scheduler.next_interval(self.state.power is False)
+
+    def preconnect_delay(self, delay: float) -> Optional[float]:
+        """Return when to reopen the connection for a poll delay seconds away.
+
+        Returns None if the connection will still be open by then.
+        """
+        idle_timeout = self.connection.idle_timeout
+        if idle_timeout and delay > idle_timeout:
+            return max(delay - PRECONNECT_LEAD, 0)
+        return None
+
+    async def refresh(self):
+        """Query the amp's status in one pipelined transaction.
+
+        In standby only the power state is asked for; otherwise source and
+        mute too, and the firmware version until it is known. The amp is
+        marked unavailable if it cannot be reached, and its power as
+        unknown if it is reachable but the power query goes unanswered.
+        """
+        commands = [self.codec.encode(FIELD_POWER)]
+        if self.state.power is not False:
+            commands.append(self.codec.encode(FIELD_SOURCE))
+            commands.append(self.codec.encode(FIELD_MUTE))
+            if self.state.firmware_version is None:
+                commands.append(self.codec.encode(FIELD_FIRMWARE_VERSION))
+        try:
+            replies = [self.codec.decode(reply) for reply, _ in await self.connection.transaction(commands)]
+        except Exception as e:
+            _LOGGER.error(f"Failed to update device state: {e}")
+            self.amp.update(available=False)
+            return
+
+        if replies[0] is not None and replies[0].field == FIELD_POWER:
+            self.amp.update(available=True)
+        elif not self.connection.connected:
+            self.amp.update(available=False)
+            return
+        else:
+            _LOGGER.warning("Could not determine power state, applying the other replies anyway")
+            self.amp.update(available=True, power=None)
+        for reply in replies:
+            if reply is not None and reply.field == FIELD_FIRMWARE_VERSION:
+                self.amp.update(firmware_version=reply.value)
+            else:
+                self.apply_reply(reply)
+
+    async def write(self, command: str) -> bool:
+        """Send a command without waiting for a reply, returning True if it was sent."""
+        if self.connection.is_unsupported(command):
+            _LOGGER.debug(f"Not sending {command}, the amp does not support it")
+            return False
+        try:
+            return await self.connection.write(command + "\r")
+        except Exception:
+            _LOGGER.error("Could not send command")
+            return False
+
+    async def write_batch(self, commands: List[str]) -> bool:
+        """Send several commands pipelined, each spaced by the link pacer."""
+        commands = [c for c in commands if not self.connection.is_unsupported(c)]
+        if not commands:
+            return True
+        self.mark_activity()
+        try:
+            return await self.connection.write("".join(command + "\r" for command in commands))
+        except Exception:
+            _LOGGER.error("Could not send commands")
+            return False
+
+    async def send_raw(self, commands: List[str]) -> List[Dict[str, Any]]:
+        """Send raw protocol commands pipelined and return every reply with its timing."""
+        replies = await self.connection.transaction(commands)
+        return [
+            {
+                "command": command,
+                "reply": reply,
+                "elapsed_ms": round(elapsed * 1000, 1),
+            }
+            for command, (reply, elapsed) in zip(commands, replies)
+        ]
+
+    async def _command_optimistic(
+        self, command: str, optimistic: Dict[str, Any], verify_command: Optional[str] = None
+    ) -> CommandResult:
+        """Send a command and show its expected effect in the state straight away.
+
+        optimistic maps AmpState fields to the values the command should
+        produce. With a verify_command the amp's confirmation reply confirms
+        or corrects them, an error reply rolls them back, and verify_command
+        is only sent when no confirmation arrives. Without one the command
+        has no confirmation and is only rolled back if it could not be sent.
+        The result is confirmed if the optimistic state was kept; it is not
+        if it was rolled back or the amp reported other values.
+        """
+        previous = {name: getattr(self.state, name) for name in optimistic}
+        self.mark_activity()
+        self.amp.update(**optimistic)
+        start = time.monotonic()
+
+        reply = error = None
+        # None until the amp reported the fields, then whether it agreed
+        agreed = None
+        if verify_command is None:
+            confirmed = await self.write(command)
+            if not confirmed:
+                error = "the command could not be sent"
+        else:
+            try:
+                reply = await self.connection.query(command)
+            except CXAProtocolError as e:
+                # An error frame settles it at once, no need to verify
+                _LOGGER.warning(f"Amp error: {e}")
+                reply, error = e.reply, str(e)
+            else:
+                agreed = self._apply_confirmation(reply, optimistic)
+                if agreed is None:
+                    reply, _ = (await self.connection.transaction(
+                        [verify_command], VERIFY_TIMEOUT
+                    ))[0]
+                    agreed = self._apply_confirmation(reply, optimistic)
+                if agreed is None:
+                    _LOGGER.warning(f"No confirmation for {command}")
+                    error = "the amp did not confirm it"
+                elif not agreed:
+                    _LOGGER.warning(f"{self.name} answered {command} with other values")
+                    error = f"the amp answered {reply}"
+            confirmed = bool(agreed)
+
+        if agreed is None and not confirmed:
+            self.amp.update(**previous)
+        journal = self.connection.journal
+        journaled = not confirmed and journal is not None and command in journal.pending()
+        if journaled:
+            error = "the amp cannot be reached, the command is sent once it is back"
+        return CommandResult(confirmed, reply, time.monotonic() - start, error, journaled)
+
+    def _apply_confirmation(self, reply: Optional[str], optimistic: Dict[str, Any]) -> Optional[bool]:
+        """Apply a status reply and return whether it reports the optimistic values.
+
+        Returns None if the reply says nothing about them.
+        """
+        decoded = self.codec.decode(reply)
+        changes = status_changes(decoded)
+        self.apply_reply(decoded)
+        if changes is None or changes.keys().isdisjoint(optimistic):
+            return None
+        return all(changes[name] == value for name, value in optimistic.items() if name in changes)
+
+    async def set_power(self, on: bool) -> CommandResult:
+        """Switch power; confirmed once the amp reports it."""
+        # Raises ValueError for anything but True or False, before the gate moves
+        command = self.codec.encode(FIELD_POWER, on)
+        if on:
+            self.power_gate.close()
+        else:
+            self.power_gate.open()
+        try:
+            result = await self._command_optimistic(
+                command, {STATE_POWER: on}, self.codec.encode(FIELD_POWER)
+            )
+        except BaseException:
+            # Cancelled or failed before a probe could open the gate again
+            if not self._probe_task:
+                self.power_gate.open()
+            raise
+
+        if on and not self.power_gate.is_ready and not self._probe_task:
+            # No confirmation yet, keep probing so held commands go out as
+            # soon as the amp answers
+            self._probe_task = asyncio.ensure_future(self._probe_power_on())
+        return result
+
+    async def _probe_power_on(self):
+        """Query the power state until the amp reports on, then open the gate."""
+        try:
+            deadline = time.monotonic() + POWER_ON_TIMEOUT
+            while not self.power_gate.is_ready and time.monotonic() < deadline:
+                reply, _ = (await self.connection.transaction(
+                    [self.codec.encode(FIELD_POWER)], VERIFY_TIMEOUT
+                ))[0]
+                self.handle_frame(reply)
+                if not self.power_gate.is_ready:
+                    await asyncio.sleep(POWER_PROBE_INTERVAL)
+            if not self.power_gate.is_ready:
+                _LOGGER.warning(f"{self.name} did not report power on within {POWER_ON_TIMEOUT}s")
+                self.power_gate.open()
+        finally:
+            self._probe_task = None
+
+    async def wait_ready(self, command: str) -> bool:
+        """Hold a command until a pending power-on has completed, returning False if it never did."""
+        if await self.power_gate.wait(POWER_ON_TIMEOUT):
+            return True
+        _LOGGER.warning(f"{self.name} is not ready, dropping {command}")
+        return False
+
+    async def set_mute(self, mute: bool) -> CommandResult:
+        """Mute or unmute; confirmed once the amp reports it."""
+        command = self.codec.encode(FIELD_MUTE, mute)
+        if not await self.wait_ready(command):
+            return CommandResult(False, error="the amp did not power on")
+        return await self._command_optimistic(
+            command, {STATE_MUTED: mute}, self.codec.encode(FIELD_MUTE)
+        )
+
+    async def set_source(self, source: str) -> CommandResult:
+        """Select a source; confirmed once the amp reports it."""
+        if source not in self.sources:
+            raise ValueError(f"Unknown source for {self.amp_type}: {source}")
+        command = self.codec.encode(FIELD_SOURCE, source)
+        if not await self.wait_ready(command):
+            return CommandResult(False, error="the amp did not power on")
+        return await self._command_optimistic(
+            command, {STATE_SOURCE: source}, self.codec.encode(FIELD_SOURCE)
+        )
+
+    async def set_speaker_output(self, speaker_output: str) -> CommandResult:
+        """Select the speaker output; confirmed once it was sent."""
+        if speaker_output not in SOUND_MODES:
+            raise ValueError(f"Unknown sound mode: {speaker_output}")
+        command = self.codec.encode(FIELD_SOUND_MODE, speaker_output)
+        if not await self.wait_ready(command):
+            return CommandResult(False, error="the amp did not power on")
+        # Speaker output cannot be queried, so what we set is all we know
+        return await self._command_optimistic(command, {STATE_SPEAKER_OUTPUT: speaker_output})
+
+    async def set(self, field: str, value: Any) -> CommandResult:
+        """Set an AmpState field on the amp.
+
+        Raises ValueError for a field or value the amp has no command for.
+        """
+        setters = {
+            STATE_POWER: self.set_power,
+            STATE_MUTED: self.set_mute,
+            STATE_SOURCE: self.set_source,
+            STATE_SPEAKER_OUTPUT: self.set_speaker_output,
+        }
+        if field not in setters:
+            raise ValueError(f"{field} cannot be set")
+        return await setters[field](value)
+
+    async def run(self):
+        """Poll the amp on the adaptive schedule until cancelled."""
+        delay = 0.0
+        while True:
+            if await self._sleep(delay):
+                # Activity after a slow spell: poll fast from now on
+                delay = self.scheduler.fast_interval
+                continue
+            await self.refresh()
+            delay = self.next_interval()
+
+    async def _sleep(self, delay: float) -> bool:
+        """Wait until the next poll is due, returning True if woken early.
+
+        A connection that will have been released by then is opened again
+        just before.
+        """
+        self._wake.clear()
+        preconnect = self.preconnect_delay(delay)
+        if preconnect is not None:
+            if await self._wait(preconnect):
+                return True
+            await self.connection.preconnect()
+            delay -= preconnect
+        return await self._wait(delay)
+
+    async def _wait(self, delay: float) -> bool:
+        """Wait delay seconds, returning True if woken before."""
+        try:
+            await asyncio.wait_for(self._wake.wait(), delay)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def close(self):
+        """Stop probing for a power-on and stop handling the amp's frames."""
+        if self._probe_task:
+            self._probe_task.cancel()
+        if self.connection.unsolicited_handler == self.handle_frame:
+            self.connection.unsolicited_handler = None
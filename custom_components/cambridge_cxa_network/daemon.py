@@ -0,0 +1,237 @@
+"""Run the amp outside Home Assistant, behind a local JSON-lines API."""
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+from dataclasses import asdict
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from .const import (
+    DAEMON_CLIENT_BACKLOG,
+    DEFAULT_DAEMON_PORT,
+    RAW_COMMAND_PATTERN,
+    SOUND_MODES,
+)
+from .controller import AmpController, CommandResult
+from .state import AmpState, STATE_MUTED, STATE_POWER, STATE_SOURCE, STATE_SPEAKER_OUTPUT
+
+_LOGGER = logging.getLogger(__name__)
+
+_RAW_COMMAND = re.compile(RAW_COMMAND_PATTERN)
+# What a client can subscribe to
+_STATE_FIELDS = frozenset(asdict(AmpState()))
+
+
+def _set_answer(result: CommandResult) -> Dict[str, Any]:
+    """Return the answer to a set request that went as result says.
+
+    A command waiting in the journal counts as done, as it goes out once
+    the amp can be reached again.
+    """
+    answer: Dict[str, Any] = {
+        "ok": result.confirmed or result.journaled,
+        "reply": result.reply,
+        "elapsed_ms": round(result.elapsed * 1000, 1),
+    }
+    if result.journaled:
+        answer["journaled"] = True
+    elif not result.confirmed:
+        answer["error"] = result.error or "the amp did not confirm it"
+    return answer
+
+
+def _raw_commands(commands: Any) -> List[str]:
+    """Return commands if they are a list of protocol commands, else raise ValueError."""
+    if not isinstance(commands, list) or not all(
+        isinstance(command, str) and _RAW_COMMAND.match(command) for command in commands
+    ):
+        raise ValueError('commands must be a list of protocol commands such as ["#01,01"]')
+    return commands
+
+
+def _check_set(controller: AmpController, field: Any, value: Any):
+    """Raise ValueError unless value is something field can be set to."""
+    if field in (STATE_POWER, STATE_MUTED):
+        # Not just truthy: 1 or "off" would be taken for True
+        if not isinstance(value, bool):
+            raise ValueError(f"{field} must be true or false")
+    elif field == STATE_SOURCE:
+        if not isinstance(value, str) or value not in controller.sources:
+            raise ValueError(f"source must be one of {', '.join(controller.sources)}")
+    elif field == STATE_SPEAKER_OUTPUT:
+        if not isinstance(value, str) or value not in SOUND_MODES:
+            raise ValueError(f"speaker_output must be one of {', '.join(SOUND_MODES)}")
+    else:
+        raise ValueError(
+            f"field must be one of {STATE_POWER}, {STATE_MUTED}, {STATE_SOURCE}, {STATE_SPEAKER_OUTPUT}"
+        )
+
+
+class AmpDaemon:
+    """Serve an AmpController to local clients as JSON lines."""
+
+    def __init__(self, controller: AmpController):
+        """Initialize without listening anywhere yet."""
+        self.controller = controller
+        self._servers: List[asyncio.AbstractServer] = []
+        self._poll_task: Optional[asyncio.Task] = None
+        # Connected clients and the tasks serving them
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def start(
+        self,
+        host: Optional[str] = "127.0.0.1",
+        port: int = DEFAULT_DAEMON_PORT,
+        unix_path: Optional[str] = None,
+    ):
+        """Start polling and listen on host:port, unix_path or both."""
+        self._poll_task = asyncio.ensure_future(self.controller.run())
+        if host is not None:
+            server = await asyncio.start_server(self._serve_client, host, port)
+            self._servers.append(server)
+            _LOGGER.info(f"Listening on {host}:{server.sockets[0].getsockname()[1]}")
+        if unix_path is not None:
+            if os.path.exists(unix_path):
+                os.unlink(unix_path)
+            self._servers.append(await asyncio.start_unix_server(self._serve_client, unix_path))
+            _LOGGER.info(f"Listening on {unix_path}")
+
+    @property
+    def port(self) -> Optional[int]:
+        """Return the TCP port actually listened on, if any."""
+        for server in self._servers:
+            name = server.sockets[0].getsockname()
+            if isinstance(name, tuple):
+                return name[1]
+        return None
+
+    async def serve_forever(self):
+        """Serve until cancelled, then close everything."""
+        try:
+            await asyncio.gather(*(server.serve_forever() for server in self._servers))
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and polling, disconnect clients and close the amp connection."""
+        for server in self._servers:
+            server.close()
+        self._servers.clear()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        for writer in self._clients:
+            writer.close()
+        # Closing their streams ends the tasks serving the clients
+        await asyncio.gather(*self._clients.values(), return_exceptions=True)
+        await self.controller.close()
+        await self.controller.connection.close()
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer one client's requests until it disconnects."""
+        self._clients[writer] = asyncio.current_task()
+        unsubscribes: List[Callable[[], None]] = []
+        requests: Set[asyncio.Task] = set()
+        outbox: asyncio.Queue = asyncio.Queue(DAEMON_CLIENT_BACKLOG)
+
+        def send(message: Dict[str, Any]):
+            try:
+                outbox.put_nowait(message)
+            except asyncio.QueueFull:
+                # Dropped rather than buffering state events for it without end
+                if not writer.is_closing():
+                    _LOGGER.warning("Client stopped reading, disconnecting it")
+                    writer.transport.abort()
+
+        async def deliver():
+            while True:
+                message = await outbox.get()
+                writer.write((json.dumps(message) + "\n").encode("utf-8"))
+                await writer.drain()
+
+        sender = asyncio.ensure_future(deliver())
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    # Over the stream limit; the reader has skipped what it buffered
+                    send({"ok": False, "error": "bad request: line too long"})
+                    continue
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("a request must be a JSON object")
+                except ValueError as e:
+                    send({"ok": False, "error": f"bad request: {e}"})
+                    continue
+                if request.get("op") == "subscribe":
+                    try:
+                        unsubscribes.append(self._subscribe(request, send))
+                    except ValueError as e:
+                        send({"id": request.get("id"), "ok": False, "error": str(e)})
+                    continue
+                task = asyncio.ensure_future(self._answer(request, send))
+                requests.add(task)
+                task.add_done_callback(requests.discard)
+        except (ConnectionError, OSError) as e:
+            _LOGGER.debug(f"Client failed: {e}")
+        finally:
+            for unsubscribe in unsubscribes:
+                unsubscribe()
+            for task in requests:
+                task.cancel()
+            sender.cancel()
+            writer.close()
+            self._clients.pop(writer, None)
+
+    def _subscribe(self, request: Dict[str, Any], send) -> Callable[[], None]:
+        """Stream state changes to a client, and acknowledge with the current state.
+
+        Raises ValueError if fields is given but not a list of AmpState fields.
+        """
+        fields = request.get("fields")
+        if fields is not None and not (
+            isinstance(fields, list)
+            and all(isinstance(field, str) and field in _STATE_FIELDS for field in fields)
+        ):
+            raise ValueError(f"fields must be a list of {', '.join(sorted(_STATE_FIELDS))}")
+
+        def listener(state: AmpState, changed):
+            send({"event": "state", "changed": sorted(changed), "state": asdict(state)})
+
+        unsubscribe = self.controller.amp.subscribe(listener, fields)
+        send({"id": request.get("id"), "ok": True, "state": asdict(self.controller.state)})
+        return unsubscribe
+
+    async def _answer(self, request: Dict[str, Any], send):
+        """Carry out one request and send its answer."""
+        answer: Dict[str, Any] = {"id": request.get("id"), "ok": True}
+        op = request.get("op")
+        try:
+            if op == "state":
+                pass
+            elif op == "refresh":
+                await self.controller.refresh()
+            elif op == "set":
+                _check_set(self.controller, request["field"], request["value"])
+                answer.update(_set_answer(
+                    await self.controller.set(request["field"], request["value"])
+                ))
+            elif op == "raw":
+                commands = _raw_commands(request["commands"])
+                start = time.monotonic()
+                answer["replies"] = await self.controller.send_raw(commands)
+                answer["elapsed_ms"] = round((time.monotonic() - start) * 1000, 1)
+            else:
+                raise ValueError(f"unknown op {op!r}")
+            answer["state"] = asdict(self.controller.state)
+        except KeyError as e:
+            answer = {"id": request.get("id"), "ok": False, "error": f"missing {e}"}
+        except Exception as e:
+            answer = {"id": request.get("id"), "ok": False, "error": str(e)}
+        send(answer)
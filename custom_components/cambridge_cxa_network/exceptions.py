@@ -0,0 +1,68 @@
+"""Exceptions for the Cambridge CXA protocol."""
+from typing import Optional
+
+from .codec import parse_frame
+from .const import (
+    ERROR_CMD_GROUP_UNKNOWN,
+    ERROR_CMD_NUMBER_UNKNOWN,
+    ERROR_CMD_DATA_ERROR,
+    ERROR_CMD_NOT_AVAILABLE,
+)
+
+
+class CXAError(Exception):
+    """Base class for Cambridge CXA errors."""
+
+
+class CXAProtocolError(CXAError):
+    """The amp answered a command with an error frame."""
+
+    # True if the command will never work on this firmware and should not be resent
+    permanent = False
+
+    def __init__(self, command: str, reply: str):
+        """Initialize with the rejected command and the error reply."""
+        super().__init__(f"{command} rejected with {reply}")
+        self.command = command
+        self.reply = reply
+
+
+class CXAGroupUnknownError(CXAProtocolError):
+    """The command group is not known to the amp (#00,01)."""
+
+    permanent = True
+
+
+class CXANumberUnknownError(CXAProtocolError):
+    """The command number is not known in its group (#00,02)."""
+
+    permanent = True
+
+
+class CXADataError(CXAProtocolError):
+    """The command data is out of range (#00,03)."""
+
+    permanent = True
+
+
+class CXANotAvailableError(CXAProtocolError):
+    """The command is valid but not available right now (#00,04)."""
+
+
+_ERRORS = {
+    parse_frame(ERROR_CMD_GROUP_UNKNOWN).number: CXAGroupUnknownError,
+    parse_frame(ERROR_CMD_NUMBER_UNKNOWN).number: CXANumberUnknownError,
+    parse_frame(ERROR_CMD_DATA_ERROR).number: CXADataError,
+    parse_frame(ERROR_CMD_NOT_AVAILABLE).number: CXANotAvailableError,
+}
+
+
+def protocol_error(command: str, reply: Optional[str]) -> Optional[CXAProtocolError]:
+    """Return the exception for an error reply, or None if the reply is not an error."""
+    if not reply:
+        return None
+    frame = parse_frame(reply)
+    if frame is None or frame.group != 0:
+        return None
+    error = _ERRORS.get(frame.number, CXAProtocolError)
+    return error(command, reply.strip())
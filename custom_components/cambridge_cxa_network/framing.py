@@ -0,0 +1,111 @@
+"""Line framing for the Cambridge CXA byte stream, with optional echo stripping."""
+import logging
+from collections import deque
+from typing import Deque, Optional
+
+_LOGGER = logging.getLogger(__name__)
+
+CR = 13
+LF = 10
+
+# Receive buffer size. CXA frames are about ten bytes; anything longer
+# than this without a terminator is line noise and gets dropped.
+DEFAULT_BUFFER_SIZE = 1024
+
+# Echoes waited for at most; older ones are taken as lost
+ECHO_BACKLOG = 32
+
+
+class LineFramer:
+    """Split a byte stream into CR/LF terminated frames."""
+
+    def __init__(self, size: int = DEFAULT_BUFFER_SIZE):
+        """Initialize an empty buffer."""
+        self._buffer = bytearray(size)
+        self._view = memoryview(self._buffer)
+        self._start = 0  # First unconsumed byte
+        self._end = 0  # End of received data
+        # Drop the bridge's echo of commands passed to expect_echo()
+        self.strip_echoes = False
+        # Commands written whose echo has not come back yet, oldest first
+        self._echoes: Deque[str] = deque(maxlen=ECHO_BACKLOG)
+
+    def __len__(self) -> int:
+        """Return the number of buffered bytes not yet returned as frames."""
+        return self._end - self._start
+
+    def clear(self):
+        """Discard everything buffered, and forget the echoes still expected."""
+        self._start = self._end = 0
+        self._echoes.clear()
+
+    def expect_echo(self, command: str):
+        """Record that command is being written, so its echo is dropped if strip_echoes is set."""
+        if self.strip_echoes:
+            self._echoes.append(command)
+
+    def _is_echo(self, frame: str) -> bool:
+        """Return True, and stop expecting it, if frame is the echo of a written command.
+
+        Echoes come back in the order the commands were written, so echoes
+        expected before this one are taken as lost.
+        """
+        if frame not in self._echoes:
+            return False
+        while self._echoes.popleft() != frame:
+            pass
+        return True
+
+    def get_buffer(self) -> memoryview:
+        """Return the free space at the end of the buffer, for recv_into()."""
+        if self._start == self._end:
+            self._start = self._end = 0
+        elif self._end == len(self._buffer):
+            if self._start == 0:
+                if self._buffer.find(CR) < 0 and self._buffer.find(LF) < 0:
+                    _LOGGER.warning(f"Dropping {self._end} bytes without a line terminator")
+                    self.clear()
+                else:
+                    # Complete frames that were fed faster than they were taken
+                    self._buffer = self._buffer + bytearray(len(self._buffer))
+                    self._view = memoryview(self._buffer)
+            else:
+                # Move the partial frame to the front; this is the only copy
+                pending = self._end - self._start
+                self._buffer[:pending] = self._view[self._start:self._end]
+                self._start, self._end = 0, pending
+        return self._view[self._end:]
+
+    def buffer_updated(self, nbytes: int):
+        """Record that nbytes were written into the last get_buffer()."""
+        self._end += nbytes
+
+    def feed(self, data: bytes):
+        """Copy received bytes into the buffer, for transports that return bytes."""
+        data = memoryview(data)
+        while data:
+            free = self.get_buffer()
+            count = min(len(free), len(data))
+            free[:count] = data[:count]
+            self.buffer_updated(count)
+            data = data[count:]
+
+    def next_frame(self) -> Optional[str]:
+        """Return the next complete frame, or None if there is none buffered yet.
+
+        Empty lines, such as the LF of a CRLF pair, and echoes are skipped.
+        """
+        buffer = self._buffer
+        while self._start < self._end:
+            cr = buffer.find(CR, self._start, self._end)
+            # An LF only matters if it comes before the first CR
+            lf = buffer.find(LF, self._start, cr if cr >= 0 else self._end)
+            stop = lf if lf >= 0 else cr
+            if stop < 0:
+                return None
+            start, self._start = self._start, stop + 1
+            if stop > start:
+                frame = str(self._view[start:stop], "utf-8", "ignore")
+                if not self._echoes or not self._is_echo(frame):
+                    return frame
+        return None
@@ -0,0 +1,99 @@
+"""Write-behind journal for commands sent while the amp cannot be reached."""
+import time
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from .codec import frame_kind, parse_frame
+from .const import (
+    AMP_CMD_SET_PWR_ON,
+    AMP_CMD_SET_PWR_STANDBY,
+    AMP_CMD_SET_MUTE_ON,
+    AMP_CMD_SET_MUTE_OFF,
+    NORMAL_INPUTS_CXA61,
+    NORMAL_INPUTS_CXA81,
+    SOUND_MODES,
+    DEFAULT_JOURNAL_EXPIRY,
+)
+
+INTENT_POWER = "power"
+INTENT_MUTE = "mute"
+INTENT_SOURCE = "source"
+INTENT_SPEAKER_OUTPUT = "speaker_output"
+
+
+# (group, number) of every command that sets something -> what it sets
+_INTENTS = {
+    frame_kind(AMP_CMD_SET_PWR_ON): INTENT_POWER,
+    frame_kind(AMP_CMD_SET_PWR_STANDBY): INTENT_POWER,
+    frame_kind(AMP_CMD_SET_MUTE_ON): INTENT_MUTE,
+    frame_kind(AMP_CMD_SET_MUTE_OFF): INTENT_MUTE,
+}
+for _command in (*NORMAL_INPUTS_CXA61.values(), *NORMAL_INPUTS_CXA81.values()):
+    _INTENTS[frame_kind(_command)] = INTENT_SOURCE
+for _command in SOUND_MODES.values():
+    _INTENTS[frame_kind(_command)] = INTENT_SPEAKER_OUTPUT
+
+
+def command_intent(command: str) -> Optional[str]:
+    """Return the setting a command changes, or None for queries and unknown commands."""
+    frame = parse_frame(command)
+    if frame is None:
+        return None
+    return _INTENTS.get((frame.group, frame.number))
+
+
+class CommandJournal:
+    """Keep the latest command per setting until it can be sent or expires."""
+
+    def __init__(self, expiry: float = DEFAULT_JOURNAL_EXPIRY):
+        """Initialize an empty journal whose commands expire after expiry seconds."""
+        self.expiry = expiry
+        # Intent -> (command, when it was journaled), oldest first
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the number of commands waiting, expired ones excluded."""
+        self._expire()
+        return len(self._entries)
+
+    def add(self, command: str) -> bool:
+        """Journal a command, replacing an older one for the same setting.
+
+        Returns False if the command was not journaled because it does not
+        set anything.
+        """
+        intent = command_intent(command)
+        if intent is None:
+            return False
+        self._entries.pop(intent, None)
+        self._entries[intent] = (command, time.monotonic())
+        return True
+
+    def discard(self, command: str):
+        """Forget the journaled command for the setting command changes, as it is superseded."""
+        intent = command_intent(command)
+        if intent is not None:
+            self._entries.pop(intent, None)
+
+    def pending(self) -> List[str]:
+        """Return the commands to replay, power first so the rest can wait for a running amp."""
+        self._expire()
+        commands = [command for command, _ in self._entries.values()]
+        power = self._entries.get(INTENT_POWER)
+        if power is not None:
+            commands.remove(power[0])
+            commands.insert(0, power[0])
+        return commands
+
+    def clear(self):
+        """Forget every journaled command."""
+        self._entries.clear()
+
+    def _expire(self):
+        """Drop commands older than expiry."""
+        cutoff = time.monotonic() - self.expiry
+        while self._entries:
+            intent, (_, journaled) = next(iter(self._entries.items()))
+            if journaled >= cutoff:
+                break
+            del self._entries[intent]
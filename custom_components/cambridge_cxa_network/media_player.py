@@ -10,10 +10,7 @@ https://github.com/jlxq0/cambridge_cxa_network
 
 import logging
 import urllib.request
-import socket
-import serial
-import asyncio
-from typing import Optional, Any
+from typing import Optional, Any, List, Tuple
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -21,51 +18,71 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.const import CONF_NAME, STATE_OFF, STATE_ON
 
 from .const import (
-    DOMAIN,
+    DATA_DEVICES,
     CONF_CONNECTION_TYPE,
     CONF_TCP_HOST,
     CONF_TCP_PORT,
     CONF_SERIAL_PORT,
     CONF_AMP_TYPE,
     CONF_CXN_IP,
+    CONF_POLL_FAST_INTERVAL,
+    CONF_POLL_FAST_WINDOW,
+    CONF_POLL_MAX_INTERVAL,
+    CONF_POLL_STANDBY_INTERVAL,
+    CONF_JOURNAL_EXPIRY,
+    CONF_LINK_TERMINATOR,
+    CONF_LINK_ECHO,
+    CONF_IDLE_TIMEOUT,
+    DEFAULT_POLL_FAST_INTERVAL,
+    DEFAULT_POLL_FAST_WINDOW,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_STANDBY_INTERVAL,
+    DEFAULT_JOURNAL_EXPIRY,
+    DEFAULT_IDLE_TIMEOUT,
     CONNECTION_TCP,
     CONNECTION_SERIAL,
-    AMP_CMD_GET_PWSTATE,
-    AMP_CMD_GET_CURRENT_SOURCE,
-    AMP_CMD_SET_MUTE_ON,
-    AMP_CMD_SET_MUTE_OFF,
-    AMP_CMD_SET_PWR_ON,
-    AMP_CMD_SET_PWR_STANDBY,
-    AMP_CMD_GET_FIRMWARE_VERSION,
-    AMP_CMD_GET_MUTE,
-    AMP_CMD_SET_SOURCE,
-    AMP_REPLY_PWR_ON,
-    AMP_REPLY_PWR_STANDBY,
-    AMP_REPLY_MUTE_ON,
-    AMP_REPLY_MUTE_OFF,
-    AMP_REPLY_FIRMWARE_VERSION,
-    AMP_REPLY_PROTOCOL_VERSION,
-    AMP_REPLY_SOURCE,
     NORMAL_INPUTS_CXA61,
     NORMAL_INPUTS_CXA81,
-    NORMAL_INPUTS_AMP_REPLY_CXA61,
-    NORMAL_INPUTS_AMP_REPLY_CXA81,
     SOUND_MODES,
-    DEFAULT_TIMEOUT,
+    GROUP_ACTION_TURN_ON,
+    GROUP_ACTION_TURN_OFF,
+    GROUP_ACTION_MUTE,
+    GROUP_ACTION_UNMUTE,
+    GROUP_ACTION_SELECT_SOURCE,
+    GROUP_ACTION_SELECT_SOUND_MODE,
+    SIGNAL_STATE_UPDATED,
+    SIGNAL_REQUEST_STATE,
+)
+from .connection import TCPSerialConnection, SerialConnection
+from .controller import AmpController
+from .journal import CommandJournal
+from .scheduler import PollScheduler
+from .state import (
+    AmpState,
+    STATE_POWER,
+    STATE_SOURCE,
+    STATE_MUTED,
+    STATE_SPEAKER_OUTPUT,
+)
+from .codec import (
+    FIELD_POWER,
+    FIELD_MUTE,
+    FIELD_SOURCE,
+    FIELD_SOUND_MODE,
 )
 
 __version__ = "2.0.0"
 
 _LOGGER = logging.getLogger(__name__)
 
-# Update interval for sensors (1 minute)
-SCAN_INTERVAL = 60
-
 SUPPORT_CXA = (
     MediaPlayerEntityFeature.SELECT_SOURCE
     | MediaPlayerEntityFeature.SELECT_SOUND_MODE
@@ -86,6 +103,13 @@ SUPPORT_CXA_WITH_CXN = (
 
 DEVICE_CLASS = "receiver"
 
+# Sorted once per model rather than on every property read
+SOURCE_LISTS = {
+    "CXA61": sorted(NORMAL_INPUTS_CXA61),
+    "CXA81": sorted(NORMAL_INPUTS_CXA81),
+}
+SOUND_MODE_LIST = sorted(SOUND_MODES)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -93,205 +117,49 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Cambridge CXA from a config entry."""
-    # Get config from storage
-    config = hass.data[DOMAIN][entry.entry_id]
+    # The device was created with the config entry, see create_device()
+    async_add_entities([hass.data[DATA_DEVICES][entry.entry_id]], True)
 
+
+def create_device(hass: HomeAssistant, entry_id: str, config: dict) -> "CambridgeCXADevice":
+    """Create the amplifier device for a config entry."""
     # Create appropriate connection based on config
     if config[CONF_CONNECTION_TYPE] == CONNECTION_TCP:
         # Network connection via USR-W610
         connection = TCPSerialConnection(
             config[CONF_TCP_HOST],
-            config[CONF_TCP_PORT]
+            config[CONF_TCP_PORT],
+            config.get(CONF_IDLE_TIMEOUT, DEFAULT_IDLE_TIMEOUT),
         )
     else:
         # Direct serial connection
         connection = SerialConnection(config[CONF_SERIAL_PORT])
 
-    # Create and add the media player entity
-    async_add_entities([
-        CambridgeCXADevice(
-            hass,
-            config[CONF_NAME],
-            connection,
-            config[CONF_AMP_TYPE],
-            config.get(CONF_CXN_IP),
-            entry.entry_id
-        )
-    ], True)
-
-
-class TCPSerialConnection:
-    """TCP connection wrapper that mimics serial interface."""
-
-    def __init__(self, host: str, port: int):
-        """Initialize TCP connection parameters."""
-        self.host = host
-        self.port = port
-        self.timeout = DEFAULT_TIMEOUT
-        self.socket = None
-        self._lock = asyncio.Lock()
-
-    async def connect(self):
-        """Establish TCP connection to USR-W610."""
-        try:
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.settimeout(self.timeout)
-            await asyncio.get_event_loop().run_in_executor(
-                None, self.socket.connect, (self.host, self.port)
-            )
-            _LOGGER.info(f"Connected to CXA via TCP at {self.host}:{self.port}")
-        except Exception as e:
-            _LOGGER.error(f"Failed to connect to {self.host}:{self.port}: {e}")
-            self.socket = None
-
-    async def ensure_connected(self):
-        """Ensure we have an active connection."""
-        if not self.socket:
-            await self.connect()
-
-    async def write(self, data: str):
-        """Write data to TCP socket."""
-        async with self._lock:
-            await self.ensure_connected()
-            if not self.socket:
-                return
-
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.socket.send, data.encode('utf-8')
-                )
-                _LOGGER.debug(f"Sent: {data.strip()}")
-            except Exception as e:
-                _LOGGER.error(f"Write failed: {e}")
-                self.socket = None
-
-    async def read_line(self) -> str:
-        """Read a line from TCP socket."""
-        if not self.socket:
-            return ""
-
-        try:
-            # Set socket to non-blocking mode for async operation
-            self.socket.setblocking(False)
-            line = b''
-            
-            while True:
-                try:
-                    char = await asyncio.get_event_loop().sock_recv(self.socket, 1)
-                    if not char:
-                        break
-                    if char == b'\r' or char == b'\n':
-                        if line:  # Only break if we have data
-                            break
-                    else:
-                        line += char
-                except socket.error:
-                    await asyncio.sleep(0.01)
-                    continue
-                    
-            result = line.decode('utf-8', errors='ignore')
-            if result:
-                _LOGGER.debug(f"Received: {result}")
-            return result
-        except Exception as e:
-            _LOGGER.error(f"Read failed: {e}")
-            self.socket = None
-            return ""
-
-    def flush(self):
-        """Flush the connection buffer."""
-        if self.socket:
-            self.socket.setblocking(False)
-            try:
-                while self.socket.recv(1024):
-                    pass
-            except:
-                pass
-            self.socket.setblocking(True)
-
-    async def close(self):
-        """Close TCP connection."""
-        if self.socket:
-            self.socket.close()
-            self.socket = None
-            _LOGGER.info("TCP connection closed")
-
+    # How the bridge frames commands, if it was learned before
+    if CONF_LINK_TERMINATOR in config:
+        connection.configure_link(config[CONF_LINK_TERMINATOR], config.get(CONF_LINK_ECHO, False))
 
-class SerialConnection:
-    """Serial connection wrapper for direct USB/RS232."""
-
-    def __init__(self, device: str):
-        """Initialize serial connection parameters."""
-        self.device = device
-        self.serial = None
-        self._lock = asyncio.Lock()
-
-    async def connect(self):
-        """Open serial port with Cambridge parameters."""
-        try:
-            self.serial = await asyncio.get_event_loop().run_in_executor(
-                None,
-                serial.Serial,
-                self.device,
-                9600,
-                serial.EIGHTBITS,
-                serial.PARITY_NONE,
-                serial.STOPBITS_ONE,
-                DEFAULT_TIMEOUT
-            )
-            _LOGGER.info(f"Connected to CXA on {self.device}")
-        except Exception as e:
-            _LOGGER.error(f"Failed to open serial port {self.device}: {e}")
-            self.serial = None
-
-    async def ensure_connected(self):
-        """Ensure serial port is open."""
-        if not self.serial or not self.serial.is_open:
-            await self.connect()
-
-    async def write(self, data: str):
-        """Write data to serial port."""
-        async with self._lock:
-            await self.ensure_connected()
-            if not self.serial:
-                return
+    # Keep commands sent while the amp is unreachable, unless switched off
+    journal_expiry = config.get(CONF_JOURNAL_EXPIRY, DEFAULT_JOURNAL_EXPIRY)
+    if journal_expiry:
+        connection.journal = CommandJournal(journal_expiry)
 
-            try:
-                await asyncio.get_event_loop().run_in_executor(
-                    None, self.serial.write, data.encode('utf-8')
-                )
-                _LOGGER.debug(f"Serial sent: {data.strip()}")
-            except Exception as e:
-                _LOGGER.error(f"Serial write failed: {e}")
-                self.serial = None
-
-    async def read_line(self) -> str:
-        """Read a line from serial port."""
-        if not self.serial:
-            return ""
+    scheduler = PollScheduler(
+        config.get(CONF_POLL_FAST_INTERVAL, DEFAULT_POLL_FAST_INTERVAL),
+        config.get(CONF_POLL_FAST_WINDOW, DEFAULT_POLL_FAST_WINDOW),
+        config.get(CONF_POLL_MAX_INTERVAL, DEFAULT_POLL_MAX_INTERVAL),
+        config.get(CONF_POLL_STANDBY_INTERVAL, DEFAULT_POLL_STANDBY_INTERVAL),
+    )
 
-        try:
-            line = await asyncio.get_event_loop().run_in_executor(
-                None, self.serial.readline
-            )
-            result = line.decode('utf-8', errors='ignore').strip()
-            if result:
-                _LOGGER.debug(f"Serial received: {result}")
-            return result
-        except Exception as e:
-            _LOGGER.error(f"Serial read failed: {e}")
-            return ""
-
-    def flush(self):
-        """Flush serial input buffer."""
-        if self.serial:
-            self.serial.flush()
-
-    async def close(self):
-        """Close serial port."""
-        if self.serial:
-            self.serial.close()
-            self.serial = None
+    return CambridgeCXADevice(
+        hass,
+        config[CONF_NAME],
+        connection,
+        config[CONF_AMP_TYPE],
+        config.get(CONF_CXN_IP),
+        entry_id,
+        scheduler,
+    )
 
 
 class CambridgeCXADevice(MediaPlayerEntity):
@@ -304,7 +172,8 @@ class CambridgeCXADevice(MediaPlayerEntity):
         connection: Any,
         amp_type: str,
         cxn_ip: Optional[str],
-        entry_id: str
+        entry_id: str,
+        scheduler: Optional[PollScheduler] = None,
     ):
         """Initialize the Cambridge CXA entity."""
         _LOGGER.debug("Setting up Cambridge CXA")
@@ -315,90 +184,32 @@ class CambridgeCXADevice(MediaPlayerEntity):
         self._cxn_ip = cxn_ip
         self._entry_id = entry_id
         
-        # State variables
-        self._mediasource = "#04,01,00"
-        self._speakersactive = ""
-        self._muted = AMP_REPLY_MUTE_OFF
-        self._pwstate = ""
-        self._state = STATE_OFF
-        self._firmware_version = None
-        self._model_name = None
-        self._last_mute_state = None  # Track mute state
-        
-        # Set up source lists based on amp type
-        if self._amp_type == "CXA61":
-            self._source_list = NORMAL_INPUTS_CXA61.copy()
-            self._source_reply_list = NORMAL_INPUTS_AMP_REPLY_CXA61.copy()
-        else:
-            self._source_list = NORMAL_INPUTS_CXA81.copy()
-            self._source_reply_list = NORMAL_INPUTS_AMP_REPLY_CXA81.copy()
-        self._sound_mode_list = SOUND_MODES.copy()
-        
+        # The amp's state, polling and commands; this entity shows them in
+        # Home Assistant and schedules the polls
+        self._controller = AmpController(connection, amp_type, scheduler, name)
+        self._controller.wake_handler = self._on_wake
+        self._controller.amp.subscribe(self._on_state_change)
+        self._cxn_volume = None  # Last volume sent to the CXN (0..1)
+        self._poll_unsub = None  # Cancels the scheduled status poll
+        self._preconnect_unsub = None  # Cancels opening the connection before it
+        self._attributes = {}  # Rebuilt only when the state is written
+        self._written = None  # What was last written to Home Assistant
+        self._diagnostics = {}  # Metrics last sent to the diagnostic sensors
+        self._added = False  # State can only be written once added to Home Assistant
+        self._polling = False  # A poll writes the state once, when it is done
+        self._sorted_sources = SOURCE_LISTS.get(self._amp_type, SOURCE_LISTS["CXA81"])
+
     async def async_update(self):
         """Update device state."""
-        try:
-            self._pwstate = await self._command_with_reply(AMP_CMD_GET_PWSTATE)
-        except Exception as e:
-            _LOGGER.error(f"Failed to update device state: {e}")
-            self._state = "unavailable"
-            return
-            
-        if self._pwstate and AMP_REPLY_PWR_ON in self._pwstate:
-            self._state = STATE_ON
-        elif self._pwstate and AMP_REPLY_PWR_STANDBY in self._pwstate:
-            self._state = STATE_OFF
-        else:
-            # If we can't determine power state, try to query other values anyway
-            _LOGGER.warning("Could not determine power state, attempting to query other values")
-            self._state = "unknown"
-        
-        # Try to get values regardless of power state
-        if self._state != "unavailable":
-            # Get source
-            try:
-                self._mediasource = await self._command_with_reply(AMP_CMD_GET_CURRENT_SOURCE)
-            except Exception:
-                _LOGGER.debug("Failed to get current source")
-            
-            # Note: CXA doesn't support mute query, we track it locally
-            # Volume also can't be queried, only set
-            
-            
-            # Get firmware and model info (only need to query occasionally)
-            if self._firmware_version is None:
-                try:
-                    fw_reply = await self._command_with_reply(AMP_CMD_GET_FIRMWARE_VERSION)
-                    if fw_reply and fw_reply.startswith(AMP_REPLY_FIRMWARE_VERSION):
-                        self._firmware_version = fw_reply.replace(AMP_REPLY_FIRMWARE_VERSION, "")
-                except Exception:
-                    _LOGGER.debug("Failed to get firmware version")
-            
-            if self._model_name is None:
-                try:
-                    model_reply = await self._command_with_reply(AMP_CMD_GET_MODEL)
-                    if model_reply and model_reply.startswith(AMP_REPLY_MODEL):
-                        self._model_name = model_reply.replace(AMP_REPLY_MODEL, "")
-                except Exception:
-                    _LOGGER.debug("Failed to get model")
-
-    async def _command(self, command):
-        """Send a command to the amplifier."""
-        try:
-            self._connection.flush()
-            await self._connection.write(command + "\r")
-            self._connection.flush()
-        except:
-            _LOGGER.error("Could not send command")
-    
-    async def _command_with_reply(self, command):
-        """Send a command and wait for reply."""
-        try:
-            await self._connection.write(command + "\r")
-            reply = await self._connection.read_line()
-            return reply
-        except:
-            _LOGGER.error("Could not send command")
-            return ""
+        await self._controller.refresh()
+
+    async def async_probe_link(self) -> Optional[Tuple[str, bool]]:
+        """Learn the bridge's line terminator and echo behaviour; see BaseConnection.probe_link()."""
+        return await self._connection.probe_link()
+
+    async def async_send_raw(self, commands: List[str]) -> List[dict]:
+        """Send raw protocol commands pipelined and return every reply with its timing."""
+        return await self._controller.send_raw(commands)
 
     def url_command(self, command):
         """Send command to CXN via HTTP."""
@@ -408,6 +219,70 @@ class CambridgeCXADevice(MediaPlayerEntity):
             except:
                 _LOGGER.error("Failed to send command to CXN")
 
+    def _schedule_poll(self, delay: float):
+        """Schedule the next status poll, replacing any scheduled one."""
+        if self._poll_unsub:
+            self._poll_unsub()
+        self._poll_unsub = async_call_later(self.hass, delay, self._async_poll)
+        if self._preconnect_unsub:
+            self._preconnect_unsub()
+            self._preconnect_unsub = None
+        preconnect = self._controller.preconnect_delay(delay)
+        if preconnect is not None:
+            # The connection will have been released by then; have it open
+            # again when the poll is due
+            self._preconnect_unsub = async_call_later(
+                self.hass, preconnect, self._async_scheduled_preconnect
+            )
+
+    async def _async_scheduled_preconnect(self, _now=None):
+        """Open the connection just before a scheduled poll."""
+        self._preconnect_unsub = None
+        await self.async_preconnect()
+
+    async def async_preconnect(self):
+        """Open the connection now, as the amp is about to be used."""
+        await self._connection.preconnect()
+
+    async def _async_poll(self, _now=None):
+        """Poll the amp's status, then schedule the next poll."""
+        self._poll_unsub = None
+        self._polling = True
+        try:
+            await self.async_update()
+        finally:
+            self._polling = False
+            # Scheduled first, so the Poll Interval sensor shows the new interval
+            self._schedule_poll(self._controller.next_interval())
+            self._async_write_if_changed()
+
+    def _on_wake(self):
+        """Poll fast from now on, after activity interrupted slow polling."""
+        if self._poll_unsub:
+            self._schedule_poll(self._controller.scheduler.fast_interval)
+
+    def _on_state_change(self, state: AmpState, changed):
+        """Show a change of the amp's state, unless a poll will show it when done."""
+        if self._added and not self._polling:
+            self._async_write_if_changed()
+
+    def async_subscribe(self, listener, fields=None):
+        """Call listener(state, changed) when any of the AmpState fields change.
+
+        Returns a function that unsubscribes it.
+        """
+        return self._controller.amp.subscribe(listener, fields)
+
+    @property
+    def amp_state(self) -> AmpState:
+        """Return the decoded amp state."""
+        return self._controller.state
+
+    @property
+    def should_poll(self):
+        """Return False, status polls are scheduled by PollScheduler instead."""
+        return False
+
     @property
     def unique_id(self):
         """Return unique ID for this entity."""
@@ -416,7 +291,7 @@ class CambridgeCXADevice(MediaPlayerEntity):
     @property
     def is_volume_muted(self):
         """Return mute state."""
-        return self._last_mute_state if self._last_mute_state is not None else False
+        return bool(self._controller.state.muted)
     
     @property
     def volume_level(self):
@@ -432,27 +307,32 @@ class CambridgeCXADevice(MediaPlayerEntity):
     @property
     def source(self):
         """Return current input source."""
-        return self._source_reply_list.get(self._mediasource, "Unknown")
+        return self._controller.state.source or "Unknown"
 
     @property
     def sound_mode(self):
         """Return current sound mode."""
-        return self._speakersactive
+        return self._controller.state.speaker_output
 
     @property
     def sound_mode_list(self):
         """Return list of available sound modes."""
-        return sorted(list(self._sound_mode_list.keys()))
+        return SOUND_MODE_LIST
 
     @property
     def source_list(self):
         """Return list of available sources."""
-        return sorted(list(self._source_list.keys()))
+        return self._sorted_sources
 
     @property
     def state(self):
         """Return the state of the device."""
-        return self._state
+        state = self._controller.state
+        if not state.available:
+            return "unavailable"
+        if state.power is None:
+            return "unknown"
+        return STATE_ON if state.power else STATE_OFF
 
     @property
     def supported_features(self):
@@ -464,39 +344,201 @@ class CambridgeCXADevice(MediaPlayerEntity):
     @property
     def extra_state_attributes(self):
         """Return entity specific state attributes."""
+        return self._attributes
+
+    def _build_attributes(self) -> dict:
+        """Build the state attributes from the cached state."""
         attrs = {}
-        if self._firmware_version:
-            attrs["firmware_version"] = self._firmware_version
-        if self._model_name:
-            attrs["model"] = self._model_name
-        if self._speakersactive:
-            attrs["speaker_output"] = self._speakersactive
+        state = self._controller.state
+        if state.firmware_version:
+            attrs["firmware_version"] = state.firmware_version
+        if state.model:
+            attrs["model"] = state.model
+        if state.speaker_output:
+            attrs["speaker_output"] = state.speaker_output
+        if self._connection.unsupported:
+            attrs["unsupported_commands"] = sorted(self._connection.unsupported)
+        if self._connection.journal:
+            attrs["journaled_commands"] = self._connection.journal.pending()
         return attrs
 
+    def _build_diagnostics(self) -> dict:
+        """Build the polling and connection metrics shown only by the diagnostic sensors.
+
+        They change with nearly every poll, so they are kept out of the
+        state attributes, where they would cause a state write each time.
+        """
+        diagnostics = {"poll_interval": self._controller.scheduler.interval}
+        if isinstance(self._connection, SerialConnection):
+            # The queue is nearly always empty by the time this runs, so
+            # the peak since the last time is what tells
+            diagnostics["io_queue_depth"] = self._connection.take_peak_queue_depth()
+        if isinstance(self._connection, TCPSerialConnection):
+            diagnostics["bridge_connects"] = self._connection.connects
+            if self._connection.connect_latency is not None:
+                diagnostics["bridge_connect_ms"] = round(self._connection.connect_latency * 1000, 1)
+            if self._connection.last_hold is not None:
+                diagnostics["bridge_slot_hold_s"] = round(self._connection.last_hold, 1)
+        return diagnostics
+
+    def _async_write_if_changed(self):
+        """Write the state to Home Assistant, unless nothing it shows has changed.
+
+        The diagnostic sensors are updated whenever their metrics change,
+        without writing the media player's state.
+        """
+        self._attributes = self._build_attributes()
+        diagnostics = self._build_diagnostics()
+        written = (self._controller.state, self._attributes)
+        if written != self._written:
+            self._written = written
+            self.async_write_ha_state()
+        elif diagnostics == self._diagnostics:
+            return
+        self._diagnostics = diagnostics
+        self._async_publish()
+
+    @callback
+    def _async_publish(self):
+        """Hand the written state and the metrics to this entry's diagnostic sensors."""
+        attributes = {**self._attributes, **self._diagnostics}
+        async_dispatcher_send(
+            self.hass, SIGNAL_STATE_UPDATED.format(self._entry_id), self.state, attributes
+        )
+
+    async def _async_set(self, setter, value) -> bool:
+        """Change a setting through the controller, returning True once the amp confirmed it."""
+        result = await setter(value)
+        self._async_write_if_changed()
+        return result.confirmed
+
+    async def _async_set_power(self, on: bool) -> bool:
+        """Switch power, returning True once the amp confirmed it."""
+        return await self._async_set(self._controller.set_power, on)
+
+    async def _async_set_mute(self, mute: bool) -> bool:
+        """Mute or unmute, returning True once the amp confirmed it."""
+        return await self._async_set(self._controller.set_mute, mute)
+
+    async def _async_set_source(self, source: str) -> bool:
+        """Select a source, returning True once the amp confirmed it."""
+        return await self._async_set(self._controller.set_source, source)
+
+    async def _async_set_sound_mode(self, sound_mode: str) -> bool:
+        """Select the speaker output, returning True if it was sent."""
+        return await self._async_set(self._controller.set_speaker_output, sound_mode)
+
     async def async_mute_volume(self, mute):
         """Mute or unmute audio."""
-        if mute:
-            await self._command(AMP_CMD_SET_MUTE_ON)
-            self._last_mute_state = True
-        else:
-            await self._command(AMP_CMD_SET_MUTE_OFF)
-            self._last_mute_state = False
+        await self._async_set_mute(mute)
 
     async def async_select_sound_mode(self, sound_mode):
         """Select sound mode."""
-        await self._command(self._sound_mode_list[sound_mode])
+        await self._async_set_sound_mode(sound_mode)
 
     async def async_select_source(self, source):
         """Select input source."""
-        await self._command(self._source_list[source])
+        await self._async_set_source(source)
 
     async def async_turn_on(self):
         """Turn the amplifier on."""
-        await self._command(AMP_CMD_SET_PWR_ON)
+        await self._async_set_power(True)
 
     async def async_turn_off(self):
         """Turn the amplifier off."""
-        await self._command(AMP_CMD_SET_PWR_STANDBY)
+        await self._async_set_power(False)
+
+    async def async_group_command(self, action: str, option: Optional[str] = None) -> bool:
+        """Run one group_command action, returning True if the amp confirmed it."""
+        if action == GROUP_ACTION_TURN_ON:
+            return await self._async_set_power(True)
+        if action == GROUP_ACTION_TURN_OFF:
+            return await self._async_set_power(False)
+        if action == GROUP_ACTION_MUTE:
+            return await self._async_set_mute(True)
+        if action == GROUP_ACTION_UNMUTE:
+            return await self._async_set_mute(False)
+        if action == GROUP_ACTION_SELECT_SOURCE:
+            return await self._async_set_source(option)
+        if action == GROUP_ACTION_SELECT_SOUND_MODE:
+            return await self._async_set_sound_mode(option)
+        raise ValueError(f"Unknown action: {action}")
+
+    def snapshot(self) -> dict:
+        """Capture the settings that restore() can put back."""
+        state = self._controller.state
+        return {
+            "power": None if state.power is None else (STATE_ON if state.power else STATE_OFF),
+            "source": state.source,
+            "muted": state.muted,
+            "sound_mode": state.speaker_output or None,
+            "volume": self._cxn_volume,
+        }
+
+    def _restore_commands(self, snapshot: dict) -> list:
+        """Return the amp commands needed to get from the cached state to a snapshot."""
+        state = self._controller.state
+        power = snapshot.get("power")
+        if power == STATE_OFF:
+            # Nothing else matters in standby
+            return [self._controller.codec.encode(FIELD_POWER, False)] if state.power is not False else []
+
+        commands = []
+        if power == STATE_ON and state.power is not True:
+            commands.append(self._controller.codec.encode(FIELD_POWER, True))
+
+        source = snapshot.get("source")
+        if source in self._controller.sources and source != state.source:
+            commands.append(self._controller.codec.encode(FIELD_SOURCE, source))
+
+        muted = snapshot.get("muted")
+        if muted is not None and muted != state.muted:
+            commands.append(self._controller.codec.encode(FIELD_MUTE, muted))
+
+        sound_mode = snapshot.get("sound_mode")
+        if sound_mode in SOUND_MODES and sound_mode != state.speaker_output:
+            commands.append(self._controller.codec.encode(FIELD_SOUND_MODE, sound_mode))
+        return commands
+
+    async def async_restore(self, snapshot: dict) -> list:
+        """Restore a snapshot, sending only the commands that change something."""
+        commands = self._restore_commands(snapshot)
+        pending = commands
+        if commands[:1] == [self._controller.codec.encode(FIELD_POWER, True)]:
+            # The rest would be lost while the amp powers up
+            await self._async_set_power(True)
+            pending = commands[1:]
+            if pending and not await self._controller.wait_ready(", ".join(pending)):
+                raise HomeAssistantError(f"{self._name} did not power on")
+        if pending and not await self._controller.write_batch(pending):
+            raise HomeAssistantError(f"Could not send restore commands to {self._name}")
+
+        # Show the restored state right away, but only what the sent commands
+        # change; the next poll corrects it if needed. Power-on has already
+        # been confirmed or rolled back by _async_set_power().
+        codec = self._controller.codec
+        restored = {}
+        if codec.encode(FIELD_POWER, False) in pending:
+            restored[STATE_POWER] = False
+        if snapshot.get("source") in self._controller.sources and (
+            codec.encode(FIELD_SOURCE, snapshot["source"]) in pending
+        ):
+            restored[STATE_SOURCE] = snapshot["source"]
+        if snapshot.get("muted") is not None and codec.encode(FIELD_MUTE, snapshot["muted"]) in pending:
+            restored[STATE_MUTED] = snapshot["muted"]
+        if snapshot.get("sound_mode") in SOUND_MODES and (
+            codec.encode(FIELD_SOUND_MODE, snapshot["sound_mode"]) in pending
+        ):
+            restored[STATE_SPEAKER_OUTPUT] = snapshot["sound_mode"]
+        self._controller.amp.update(**restored)
+
+        volume = snapshot.get("volume")
+        if volume is not None and self._cxn_ip and volume != self._cxn_volume:
+            await self.async_set_volume_level(volume)
+            commands.append(f"cxn volume {int(volume * 100)}")
+
+        self._async_write_if_changed()
+        return commands
 
     async def async_volume_up(self):
         """Increase volume by one step."""
@@ -524,20 +566,47 @@ class CambridgeCXADevice(MediaPlayerEntity):
             # Use CXN for volume control
             volume_int = int(volume * 100)
             self.url_command(f"smoip/zone/volume?zone=1&level={volume_int}")
+            self._cxn_volume = volume
         else:
             # CXA does not support volume control via RS232
             _LOGGER.warning("Volume control not available via RS232")
     
+    async def _async_step_source(self, step: int) -> bool:
+        """Select the source step places away from the current one, wrapping around."""
+        # CXA doesn't have next/prev source commands, so select it directly
+        sources = list(self._controller.sources)
+        current = self._controller.state.source
+        index = sources.index(current) + step if current in sources else 0
+        return await self._async_set_source(sources[index % len(sources)])
+
     async def async_select_next_source(self):
         """Select next input source."""
-        # CXA doesn't have next/prev source commands
-        _LOGGER.info("Next source command not supported by CXA")
+        await self._async_step_source(1)
     
     async def async_select_prev_source(self):
         """Select previous input source."""
-        # CXA doesn't have next/prev source commands
-        _LOGGER.info("Previous source command not supported by CXA")
+        await self._async_step_source(-1)
+
+    async def async_added_to_hass(self):
+        """Start handling frames the amp sends on its own, and polling."""
+        self._added = True
+        self.async_on_remove(async_dispatcher_connect(
+            self.hass, SIGNAL_REQUEST_STATE.format(self._entry_id), self._async_publish
+        ))
+        # Entities added before us are waiting for the state
+        self._attributes = self._build_attributes()
+        self._diagnostics = self._build_diagnostics()
+        self._async_publish()
+        self._schedule_poll(self._controller.next_interval())
 
     async def async_will_remove_from_hass(self):
         """Clean up when entity is removed."""
+        self._added = False
+        if self._poll_unsub:
+            self._poll_unsub()
+            self._poll_unsub = None
+        if self._preconnect_unsub:
+            self._preconnect_unsub()
+            self._preconnect_unsub = None
+        await self._controller.close()
         await self._connection.close()
\ No newline at end of file
@@ -14,6 +14,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
+    DATA_DEVICES,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -42,12 +43,13 @@ async def async_setup_entry(
     
     from .const import CONF_CXN_IP
     
-    # Only add volume control if CXN is configured
-    if not entry.data.get(CONF_CXN_IP):
+    # Only add volume control if CXN is configured, in the data or the options
+    if not hass.data[DOMAIN][entry.entry_id].get(CONF_CXN_IP):
         _LOGGER.info("No CXN IP configured, volume control not available via RS232")
         return
     
     entities = []
+    device = hass.data[DATA_DEVICES][entry.entry_id]
     
     for description in NUMBER_DESCRIPTIONS:
         entities.append(
@@ -55,24 +57,30 @@ async def async_setup_entry(
                 hass,
                 entry,
                 description,
+                device,
             )
         )
     
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class CambridgeCXANumber(NumberEntity):
     """Representation of a Cambridge CXA number control."""
 
+    # The volume cannot be read back, so there is nothing to poll for
+    _attr_should_poll = False
+
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         description: NumberEntityDescription,
+        device,
     ) -> None:
         """Initialize the number entity."""
         self._hass = hass
         self._entry = entry
+        self._device = device  # The entry's CambridgeCXADevice, called directly
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -83,46 +91,19 @@ class CambridgeCXANumber(NumberEntity):
         )
         self._attr_native_value = 0
 
-    async def async_update(self) -> None:
-        """Update the number state."""
-        # Get the media player entity
-        media_player_entity_id = f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"
-        media_player = self._hass.states.get(media_player_entity_id)
-        
-        if not media_player:
-            return
-        
-        # For now, we can't read the volume from the amplifier
-        # This would require CXN integration
-        if self.entity_description.key == "volume":
-            # TODO: Implement volume reading when CXN protocol is known
-            pass
-
     async def async_set_native_value(self, value: float) -> None:
         """Update the current value."""
-        # Get the media player entity
-        media_player_entity_id = f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"
+        # Since we don't have direct volume control via CXA protocol,
+        # we'll use the CXN HTTP API through the media player
+        current_volume = self._attr_native_value or 0
+        steps = int(value - current_volume)
+        
+        if steps > 0:
+            for _ in range(steps):
+                await self._device.async_volume_up()
+        elif steps < 0:
+            for _ in range(abs(steps)):
+                await self._device.async_volume_down()
         
-        # Find the media player entity and call volume control
-        media_player = self._hass.data.get("media_player")
-        if not media_player:
-            _LOGGER.error("Could not find media_player platform")
-            return
-            
-        for entity in media_player.entities:
-            if entity.entity_id == media_player_entity_id:
-                # Since we don't have direct volume control via CXA protocol,
-                # we'll use the CXN HTTP API through the media player
-                # The media player should implement volume control via CXN
-                current_volume = self._attr_native_value or 0
-                steps = int(value - current_volume)
-                
-                if steps > 0:
-                    for _ in range(steps):
-                        await entity.async_volume_up()
-                elif steps < 0:
-                    for _ in range(abs(steps)):
-                        await entity.async_volume_down()
-                
-                self._attr_native_value = value
-                break
\ No newline at end of file
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,50 @@
+"""Pacing of writes to the amp's 9600 baud serial line."""
+import asyncio
+import time
+from typing import List
+
+from .const import LINK_BYTES_PER_SECOND, AMP_COMMAND_GAP
+
+
+class LinkPacer:
+    """Minimum spacing of the commands written to the amp."""
+
+    def __init__(
+        self,
+        bytes_per_second: float = LINK_BYTES_PER_SECOND,
+        command_gap: float = AMP_COMMAND_GAP,
+    ):
+        """Initialize with the line free."""
+        self.rate = bytes_per_second
+        self.command_gap = command_gap
+        # When the line and the amp are ready for the next command
+        self._ready_at = 0.0
+        # How often and for how long writes were held back
+        self.waits = 0
+        self.waited = 0.0
+
+    def interval(self, command: str) -> float:
+        """Return how long a command, terminator included, holds the line and the amp."""
+        return len(command) / self.rate + self.command_gap
+
+    async def take(self, commands: List[str]) -> List[str]:
+        """Wait until the first command may go out, and return the ones that may go with it.
+
+        Only commands whose slot has already come go together, so with
+        the real line rate that is the first command alone.
+        """
+        delay = self._ready_at - time.monotonic()
+        if delay > 0:
+            self.waits += 1
+            self.waited += delay
+            await asyncio.sleep(delay)
+
+        ready_at = max(self._ready_at, time.monotonic())
+        batch = []
+        for command in commands:
+            if batch and ready_at > time.monotonic():
+                break
+            batch.append(command)
+            ready_at += self.interval(command)
+        self._ready_at = ready_at
+        return batch
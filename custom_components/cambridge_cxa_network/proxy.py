@@ -0,0 +1,150 @@
+"""Local proxy sharing one amp connection between many line-protocol clients."""
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from .connection import BaseConnection
+from .const import DEFAULT_PROXY_PORT, PROXY_WATCH_INTERVAL
+from .framing import LineFramer
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MultiplexProxy:
+    """Serve one upstream amp connection to many downstream clients."""
+
+    def __init__(
+        self,
+        upstream: BaseConnection,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PROXY_PORT,
+    ):
+        """Initialize the proxy; nothing is opened until start()."""
+        self.upstream = upstream
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        # Connected clients and the tasks serving them
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+        self._watch_task: Optional[asyncio.Task] = None
+        # Transactions in flight; while there are any they read for the watcher
+        self._busy = 0
+
+    @property
+    def clients(self) -> int:
+        """Return the number of connected downstream clients."""
+        return len(self._clients)
+
+    async def start(self):
+        """Connect upstream and start accepting clients."""
+        self.upstream.unsolicited_handler = self._broadcast
+        await self.upstream.ensure_connected()
+        self._server = await asyncio.start_server(self._serve_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._watch_task = asyncio.ensure_future(self._watch())
+        _LOGGER.info(f"Proxying the amp on {self.host}:{self.port}")
+
+    async def serve_forever(self):
+        """Start if needed, and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Disconnect every client and the upstream connection."""
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            self._watch_task = None
+        if self._server is not None:
+            self._server.close()
+            self._server = None
+        for writer in self._clients:
+            writer.close()
+        # Closing their streams ends the tasks serving the clients
+        await asyncio.gather(*self._clients.values(), return_exceptions=True)
+        self.upstream.unsolicited_handler = None
+        await self.upstream.close()
+
+    async def _serve_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Relay one client's commands upstream and its replies back."""
+        peer = writer.get_extra_info("peername")
+        _LOGGER.info(f"Client {peer} connected, {len(self._clients) + 1} in total")
+        self._clients[writer] = asyncio.current_task()
+        framer = LineFramer()
+        # Commands read from the client, relayed in order while more arrive;
+        # None once it has sent everything
+        commands: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        relay = asyncio.ensure_future(self._relay(commands, writer))
+        try:
+            while True:
+                data = await reader.read(1024)
+                if not data:
+                    break
+                framer.feed(data)
+                while (frame := framer.next_frame()) is not None:
+                    commands.put_nowait(frame.strip())
+            # Commands sent just before the client hung up still go out
+            commands.put_nowait(None)
+            await relay
+        except (ConnectionError, OSError) as e:
+            _LOGGER.debug(f"Client {peer} failed: {e}")
+        finally:
+            relay.cancel()
+            await asyncio.gather(relay, return_exceptions=True)
+            self._clients.pop(writer, None)
+            writer.close()
+            _LOGGER.info(f"Client {peer} disconnected, {len(self._clients)} left")
+
+    async def _relay(self, commands: "asyncio.Queue[Optional[str]]", writer: asyncio.StreamWriter):
+        """Send a client's commands upstream in order and write the replies back.
+
+        Everything queued by the time the previous commands are done goes
+        up as one pipelined transaction.
+        """
+        try:
+            while True:
+                batch = [await commands.get()]
+                while not commands.empty():
+                    batch.append(commands.get_nowait())
+                finished = batch[-1] is None
+                if finished:
+                    batch.pop()
+                replies = await self._send_upstream(batch) if batch else ""
+                if replies:
+                    writer.write(replies.encode("utf-8"))
+                    await writer.drain()
+                if finished:
+                    return
+        except (ConnectionError, OSError) as e:
+            _LOGGER.debug(f"Relaying to a client failed: {e}")
+
+    async def _send_upstream(self, commands: List[str]) -> str:
+        """Send commands upstream and return their replies as the client should get them."""
+        self._busy += 1
+        try:
+            results = await self.upstream.transaction(commands)
+        finally:
+            self._busy -= 1
+        return "".join(reply + "\r" for reply, _ in results if reply)
+
+    def _broadcast(self, frame: str):
+        """Send a frame nobody asked for to every client."""
+        data = (frame + "\r").encode("utf-8")
+        for writer in list(self._clients):
+            if writer.is_closing():
+                continue
+            writer.write(data)
+
+    async def _watch(self):
+        """Pick up frames the amp sends on its own while no transaction is reading."""
+        while True:
+            await asyncio.sleep(PROXY_WATCH_INTERVAL)
+            if self._busy or not self.upstream.connected:
+                continue
+            try:
+                await self.upstream.flush()
+            except Exception as e:
+                _LOGGER.debug(f"Reading unsolicited frames failed: {e}")
@@ -0,0 +1,199 @@
+"""Map which commands a given amp firmware understands."""
+import json
+import logging
+import os
+import time
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .codec import frame_kind, parse_frame
+from .connection import BaseConnection
+from .const import AMP_CMD_SET_PWR_STANDBY
+from .exceptions import (
+    CXADataError,
+    CXAGroupUnknownError,
+    CXANotAvailableError,
+    CXANumberUnknownError,
+    protocol_error,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# How a command was answered
+RESULT_VALID = "valid"
+RESULT_GROUP_UNKNOWN = "group_unknown"
+RESULT_NUMBER_UNKNOWN = "number_unknown"
+RESULT_DATA_ERROR = "data_error"
+RESULT_NOT_AVAILABLE = "not_available"
+RESULT_ERROR = "error"
+RESULT_TIMEOUT = "timeout"
+
+_ERROR_RESULTS = {
+    CXAGroupUnknownError: RESULT_GROUP_UNKNOWN,
+    CXANumberUnknownError: RESULT_NUMBER_UNKNOWN,
+    CXADataError: RESULT_DATA_ERROR,
+    CXANotAvailableError: RESULT_NOT_AVAILABLE,
+}
+
+RESULTS_VERSION = 1
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_SKIP = (AMP_CMD_SET_PWR_STANDBY,)
+
+
+def classify(command: str, reply: Optional[str]) -> str:
+    """Return how the amp answered command."""
+    if reply is None:
+        return RESULT_TIMEOUT
+    error = protocol_error(command, reply)
+    if error is None:
+        return RESULT_VALID
+    return _ERROR_RESULTS.get(type(error), RESULT_ERROR)
+
+
+def parse_range(spec: str) -> List[str]:
+    """Expand "1-20,25" into the values it names.
+
+    Values keep the width of the number they were written with, so
+    "00-15" gives "00", "01", ... "15". An empty spec names no values.
+    """
+    values = []
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        first, _, last = part.partition("-")
+        width = len(first)
+        for value in range(int(first), int(last or first) + 1):
+            values.append(f"{value:0{width}d}")
+    return values
+
+
+def candidates(groups: str, numbers: str, data: str = "") -> Iterator[str]:
+    """Yield the commands to scan: every number of every group, then every data value for it."""
+    data_values = parse_range(data)
+    for group in parse_range(groups):
+        for number in parse_range(numbers):
+            command = f"#{int(group):02d},{int(number):02d}"
+            yield command
+            for value in data_values:
+                yield f"{command},{value}"
+
+
+class CommandScanner:
+    """Send candidate commands in paced batches and record how each was answered."""
+
+    def __init__(
+        self,
+        connection: BaseConnection,
+        results_path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        timeout: Optional[float] = None,
+        skip: Iterable[str] = DEFAULT_SKIP,
+    ):
+        """Initialize, loading the results of an earlier run of the same file.
+
+        timeout is the reply deadline per command, by default the
+        connection's own. A command in skip without data also skips every
+        data variant of it, so "#01,12" keeps "#01,12,0" from being sent.
+        """
+        self.connection = connection
+        self.results_path = results_path
+        self.batch_size = batch_size
+        self.timeout = timeout
+        # Parsed, so "#1,12" and "#01,12" skip the same thing
+        self.skip = {parse_frame(command) for command in skip}
+        # Command -> {"result", "reply", "ms"}
+        self.results: Dict[str, dict] = {}
+        # Groups and (group, number) pairs the amp said it does not know
+        self._dead_groups: Set[int] = set()
+        self._dead_numbers: Set[Tuple[int, int]] = set()
+        if os.path.exists(results_path):
+            with open(results_path, encoding="utf-8") as file:
+                for command, result in json.load(file).get("results", {}).items():
+                    self._record(command, result)
+            _LOGGER.info(f"Resuming with {len(self.results)} commands already scanned")
+
+    def _record(self, command: str, result: dict):
+        """Keep a result and note what it rules out."""
+        self.results[command] = result
+        group, number = frame_kind(command)
+        if result["result"] == RESULT_GROUP_UNKNOWN:
+            self._dead_groups.add(group)
+        elif result["result"] == RESULT_NUMBER_UNKNOWN:
+            self._dead_numbers.add((group, number))
+
+    def _wanted(self, command: str) -> bool:
+        """Return True if command still needs to be sent."""
+        if command in self.results:
+            return False
+        frame = parse_frame(command)
+        if frame in self.skip or frame._replace(data=None) in self.skip:
+            return False
+        return frame.group not in self._dead_groups and (
+            (frame.group, frame.number) not in self._dead_numbers
+        )
+
+    def save(self):
+        """Write the results, replacing the file in one step so a crash never truncates it."""
+        temporary = f"{self.results_path}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            json.dump({"version": RESULTS_VERSION, "results": self.results}, file, indent=1)
+        os.replace(temporary, self.results_path)
+
+    async def run(
+        self,
+        commands: Iterable[str],
+        progress: Optional[Callable[[int, float], None]] = None,
+    ) -> Dict[str, int]:
+        """Scan commands and return how many got each result, this run and earlier ones.
+
+        progress is called after every batch with the number of commands
+        sent so far in this run and the seconds taken.
+        """
+        start = time.monotonic()
+        sent = 0
+        commands = iter(commands)
+        # Commands sent after a missed reply in the same batch, to send again
+        retry: List[str] = []
+        retried: Set[str] = set()
+        while True:
+            batch = [command for command in retry if self._wanted(command)]
+            retry = []
+            for command in commands:
+                if self._wanted(command):
+                    batch.append(command)
+                    if len(batch) >= self.batch_size:
+                        break
+            if not batch:
+                break
+
+            replies = await self.connection.transaction(batch, self.timeout)
+            sent += len(batch)
+            missed = False
+            for command, (reply, elapsed) in zip(batch, replies):
+                if missed and command not in retried:
+                    # A late reply may have been taken for this command's,
+                    # so it is sent again, once
+                    retry.append(command)
+                    retried.add(command)
+                    continue
+                result = classify(command, reply)
+                missed = missed or result == RESULT_TIMEOUT
+                ms = round(elapsed * 1000, 1) if reply is not None else None
+                self._record(command, {"result": result, "reply": reply, "ms": ms})
+            self.save()
+            if progress is not None:
+                progress(sent, time.monotonic() - start)
+
+        # A frame the amp sent on its own in the middle of a batch is taken
+        # for a reply, so every command found valid is sent once more alone
+        for command, result in list(self.results.items()):
+            if result["result"] == RESULT_VALID and not result.get("confirmed"):
+                reply, elapsed = (await self.connection.transaction([command], self.timeout))[0]
+                ms = round(elapsed * 1000, 1) if reply is not None else None
+                self._record(
+                    command,
+                    {"result": classify(command, reply), "reply": reply, "ms": ms, "confirmed": True},
+                )
+                self.save()
+
+        summary: Dict[str, int] = {}
+        for result in self.results.values():
+            summary[result["result"]] = summary.get(result["result"], 0) + 1
+        return summary
@@ -0,0 +1,55 @@
+"""Adaptive status polling for the Cambridge CXA."""
+import time
+
+from .const import (
+    DEFAULT_POLL_FAST_INTERVAL,
+    DEFAULT_POLL_FAST_WINDOW,
+    DEFAULT_POLL_MAX_INTERVAL,
+    DEFAULT_POLL_STANDBY_INTERVAL,
+)
+
+
+class PollScheduler:
+    """Decide how long to wait before the next status poll.
+
+    For fast_window seconds after activity() the amp is polled every
+    fast_interval. After that the interval doubles with every poll that
+    finds nothing new, up to max_interval. In standby the interval is
+    standby_interval.
+    """
+
+    def __init__(
+        self,
+        fast_interval: float = DEFAULT_POLL_FAST_INTERVAL,
+        fast_window: float = DEFAULT_POLL_FAST_WINDOW,
+        max_interval: float = DEFAULT_POLL_MAX_INTERVAL,
+        standby_interval: float = DEFAULT_POLL_STANDBY_INTERVAL,
+    ):
+        """Initialize the schedule, starting fast."""
+        self.fast_interval = fast_interval
+        self.fast_window = fast_window
+        self.max_interval = max(max_interval, fast_interval)
+        self.standby_interval = standby_interval
+        # The delay last handed out by next_interval()
+        self.interval = fast_interval
+        self._fast_until = time.monotonic() + fast_window
+
+    @property
+    def is_fast(self) -> bool:
+        """Return True while polling at fast_interval after activity."""
+        return time.monotonic() < self._fast_until
+
+    def activity(self):
+        """Poll fast again, after a command was sent or a change was seen."""
+        self._fast_until = time.monotonic() + self.fast_window
+        self.interval = self.fast_interval
+
+    def next_interval(self, standby: bool) -> float:
+        """Return the delay until the next poll after one has completed."""
+        if self.is_fast:
+            self.interval = self.fast_interval
+        elif standby:
+            self.interval = self.standby_interval
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        return self.interval
@@ -7,19 +7,27 @@ from homeassistant.components.select import (
     SelectEntityDescription,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DOMAIN,
+    DATA_DEVICES,
     SOUND_MODES,
     NORMAL_INPUTS_CXA61,
     NORMAL_INPUTS_CXA81,
 )
+from .state import AmpState, STATE_SOURCE, STATE_SPEAKER_OUTPUT
 
 _LOGGER = logging.getLogger(__name__)
 
+# Source options per model, built once
+SOURCE_OPTIONS = {
+    "CXA61": list(NORMAL_INPUTS_CXA61),
+    "CXA81": list(NORMAL_INPUTS_CXA81),
+}
+
 SELECT_DESCRIPTIONS = [
     SelectEntityDescription(
         key="speaker_output",
@@ -43,6 +51,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up Cambridge CXA select entities."""
     entities = []
+    device = hass.data[DATA_DEVICES][entry.entry_id]
     
     for description in SELECT_DESCRIPTIONS:
         entities.append(
@@ -50,24 +59,29 @@ async def async_setup_entry(
                 hass,
                 entry,
                 description,
+                device,
             )
         )
     
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class CambridgeCXASelect(SelectEntity):
-    """Representation of a Cambridge CXA select entity."""
+    """Representation of a Cambridge CXA select entity, following the amp's state."""
+
+    _attr_should_poll = False
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         description: SelectEntityDescription,
+        device,
     ) -> None:
         """Initialize the select entity."""
         self._hass = hass
         self._entry = entry
+        self._device = device  # The entry's CambridgeCXADevice, called directly
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -80,59 +94,37 @@ class CambridgeCXASelect(SelectEntity):
         
         # Set options based on entity type
         if description.key == "source":
-            amp_type = entry.data.get("amp_type", "CXA61").upper()
-            if amp_type == "CXA61":
-                self._attr_options = list(NORMAL_INPUTS_CXA61.keys())
-            else:
-                self._attr_options = list(NORMAL_INPUTS_CXA81.keys())
+            # The same options-over-data view the media player is built from
+            amp_type = hass.data[DOMAIN][entry.entry_id].get("amp_type", "CXA61").upper()
+            self._attr_options = SOURCE_OPTIONS.get(amp_type, SOURCE_OPTIONS["CXA81"])
         else:
             self._attr_options = description.options
 
-    async def async_update(self) -> None:
-        """Update the select state."""
-        # Get the media player entity
-        media_player_entity_id = f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"
-        media_player = self._hass.states.get(media_player_entity_id)
-        
-        if not media_player:
-            return
-        
-        # Update based on select type
+    @property
+    def _field(self) -> str:
+        """Return the AmpState field this entity selects."""
         if self.entity_description.key == "speaker_output":
-            sound_mode = media_player.attributes.get("sound_mode", None)
-            if sound_mode in self.options:
-                self._attr_current_option = sound_mode
-        elif self.entity_description.key == "source":
-            source = media_player.attributes.get("source", None)
-            if source in self.options:
-                self._attr_current_option = source
+            return STATE_SPEAKER_OUTPUT
+        return STATE_SOURCE
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the amp's state instead of polling it."""
+        option = getattr(self._device.amp_state, self._field)
+        if option in self.options:
+            self._attr_current_option = option
+        self.async_on_remove(self._device.async_subscribe(self._async_amp_changed, (self._field,)))
+
+    @callback
+    def _async_amp_changed(self, state: AmpState, changed) -> None:
+        """Update from the amp's state, writing only if the option changed."""
+        option = getattr(state, self._field)
+        if option in self.options and option != self._attr_current_option:
+            self._attr_current_option = option
+            self.async_write_ha_state()
 
     async def async_select_option(self, option: str) -> None:
-        """Change the selected option."""
-        # Get the media player entity
-        media_player_entity_id = f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"
-        
+        """Change the selected option; current_option follows the amp's state."""
         if self.entity_description.key == "speaker_output":
-            # Call the sound mode service on the media player
-            await self._hass.services.async_call(
-                "media_player",
-                "select_sound_mode",
-                {
-                    "entity_id": media_player_entity_id,
-                    "sound_mode": option,
-                },
-                blocking=True,
-            )
+            await self._device.async_select_sound_mode(option)
         elif self.entity_description.key == "source":
-            # Call the source selection service on the media player
-            await self._hass.services.async_call(
-                "media_player",
-                "select_source",
-                {
-                    "entity_id": media_player_entity_id,
-                    "source": option,
-                },
-                blocking=True,
-            )
-        
-        self._attr_current_option = option
\ No newline at end of file
+            await self._device.async_select_source(option)
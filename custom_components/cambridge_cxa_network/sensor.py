@@ -2,25 +2,40 @@
 import logging
 from typing import Optional, Any
 
-from datetime import timedelta
-
 from homeassistant.components.sensor import (
     SensorEntity,
     SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import STATE_OFF, STATE_ON, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect, async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN
+from .const import (
+    DOMAIN,
+    DATA_DEVICES,
+    CONF_CONNECTION_TYPE,
+    CONNECTION_SERIAL,
+    CONNECTION_TCP,
+    SIGNAL_STATE_UPDATED,
+    SIGNAL_REQUEST_STATE,
+)
+from .state import (
+    AmpState,
+    STATE_AVAILABLE,
+    STATE_FIRMWARE_VERSION,
+    STATE_MODEL,
+    STATE_MUTED,
+    STATE_POWER,
+    STATE_SOURCE,
+    STATE_SPEAKER_OUTPUT,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
-# Scan interval for sensors (1 minute)
-SCAN_INTERVAL = timedelta(minutes=1)
-
 SENSOR_DESCRIPTIONS = [
     SensorEntityDescription(
         key="power_state",
@@ -57,6 +72,64 @@ SENSOR_DESCRIPTIONS = [
         name="Protocol Version",
         icon="mdi:file-document",
     ),
+    SensorEntityDescription(
+        key="poll_interval",
+        name="Poll Interval",
+        icon="mdi:timer-sync",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+# Sensors showing the amp's state -> the AmpState fields they follow; the
+# others show the media player's diagnostic attributes
+STATE_SENSOR_FIELDS = {
+    "power_state": (STATE_AVAILABLE, STATE_POWER),
+    "current_source": (STATE_SOURCE,),
+    "mute_state": (STATE_MUTED,),
+    "speaker_output": (STATE_SPEAKER_OUTPUT,),
+    "connection_status": (STATE_AVAILABLE,),
+    "firmware_version": (STATE_FIRMWARE_VERSION,),
+    "protocol_version": (STATE_MODEL,),
+}
+
+# Only meaningful for direct serial connections, which do blocking I/O on their own thread
+SERIAL_SENSOR_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key="io_queue_depth",
+        name="Peak I/O Queue Depth",
+        icon="mdi:tray-full",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+]
+
+# Only meaningful for network connections, which release the bridge's client slot when idle
+TCP_SENSOR_DESCRIPTIONS = [
+    SensorEntityDescription(
+        key="bridge_connects",
+        name="Bridge Connects",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="bridge_connect_ms",
+        name="Bridge Connect Time",
+        icon="mdi:lan-connect",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
+    SensorEntityDescription(
+        key="bridge_slot_hold_s",
+        name="Bridge Slot Hold Time",
+        icon="mdi:lan-pending",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+    ),
 ]
 
 
@@ -66,33 +139,44 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Cambridge CXA sensors."""
-    # Get the media player entity
     entities = []
+    device = hass.data[DATA_DEVICES][entry.entry_id]
+    descriptions = list(SENSOR_DESCRIPTIONS)
+    connection_type = hass.data[DOMAIN][entry.entry_id].get(CONF_CONNECTION_TYPE)
+    if connection_type == CONNECTION_SERIAL:
+        descriptions.extend(SERIAL_SENSOR_DESCRIPTIONS)
+    elif connection_type == CONNECTION_TCP:
+        descriptions.extend(TCP_SENSOR_DESCRIPTIONS)
     
-    for description in SENSOR_DESCRIPTIONS:
+    for description in descriptions:
         entities.append(
             CambridgeCXASensor(
                 hass,
                 entry,
                 description,
+                device,
             )
         )
     
-    async_add_entities(entities, True)
+    async_add_entities(entities)
 
 
 class CambridgeCXASensor(SensorEntity):
-    """Representation of a Cambridge CXA sensor."""
+    """Representation of a Cambridge CXA sensor, updated by the media player."""
+
+    _attr_should_poll = False
 
     def __init__(
         self,
         hass: HomeAssistant,
         entry: ConfigEntry,
         description: SensorEntityDescription,
+        device,
     ) -> None:
         """Initialize the sensor."""
         self._hass = hass
         self._entry = entry
+        self._device = device  # The entry's CambridgeCXADevice
         self.entity_description = description
         self._attr_unique_id = f"{entry.entry_id}_{description.key}"
         self._attr_device_info = DeviceInfo(
@@ -103,50 +187,69 @@ class CambridgeCXASensor(SensorEntity):
         )
         self._attr_native_value = None
 
-    async def async_update(self) -> None:
-        """Update the sensor state."""
-        # Get the media player entity from the same integration
-        media_player = None
-        
-        # Find the media player entity from our device
-        device_registry = self._hass.helpers.device_registry.async_get()
-        entity_registry = self._hass.helpers.entity_registry.async_get()
-        
-        # Get our device
-        device = device_registry.async_get_device(identifiers={(DOMAIN, self._entry.entry_id)})
-        
-        if device:
-            # Find media player entity for this device
-            for entity in entity_registry.entities.values():
-                if entity.device_id == device.id and entity.domain == "media_player":
-                    media_player = self._hass.states.get(entity.entity_id)
-                    break
-        
-        if not media_player:
-            # Fallback - try common entity IDs
-            for entity_id in ["media_player.cambridge_audio_cxa", 
-                              f"media_player.{self._entry.data.get('name', 'cambridge_cxa').lower().replace(' ', '_')}"]:
-                media_player = self._hass.states.get(entity_id)
-                if media_player:
-                    break
-        
-        if not media_player:
-            self._attr_native_value = "Unavailable"
+    async def async_added_to_hass(self) -> None:
+        """Follow the amp's state, or the media player's attributes, instead of polling."""
+        fields = STATE_SENSOR_FIELDS.get(self.entity_description.key)
+        if fields is not None:
+            self._update_from_amp(self._device.amp_state)
+            self.async_on_remove(self._device.async_subscribe(self._async_amp_changed, fields))
             return
-        
-        # Update based on sensor type
-        if self.entity_description.key == "power_state":
-            self._attr_native_value = media_player.state
-        elif self.entity_description.key == "current_source":
-            self._attr_native_value = media_player.attributes.get("source", "Unknown")
-        elif self.entity_description.key == "mute_state":
-            self._attr_native_value = "Muted" if media_player.attributes.get("is_volume_muted", False) else "Unmuted"
-        elif self.entity_description.key == "speaker_output":
-            self._attr_native_value = media_player.attributes.get("sound_mode", "Unknown")
-        elif self.entity_description.key == "connection_status":
-            self._attr_native_value = "Connected" if media_player.state != "unavailable" else "Disconnected"
-        elif self.entity_description.key == "firmware_version":
-            self._attr_native_value = media_player.attributes.get("firmware_version", "Unknown")
-        elif self.entity_description.key == "protocol_version":
+        self.async_on_remove(async_dispatcher_connect(
+            self._hass,
+            SIGNAL_STATE_UPDATED.format(self._entry.entry_id),
+            self._async_media_player_updated,
+        ))
+        async_dispatcher_send(self._hass, SIGNAL_REQUEST_STATE.format(self._entry.entry_id))
+
+    @callback
+    def _async_amp_changed(self, state: AmpState, changed) -> None:
+        """Update from the amp's state, writing only if the value changed."""
+        previous = self._attr_native_value
+        self._update_from_amp(state)
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+    def _update_from_amp(self, state: AmpState) -> None:
+        """Set the sensor value from the amp's state."""
+        key = self.entity_description.key
+        if key == "power_state":
+            if not state.available:
+                self._attr_native_value = "unavailable"
+            elif state.power is None:
+                self._attr_native_value = "unknown"
+            else:
+                self._attr_native_value = STATE_ON if state.power else STATE_OFF
+        elif key == "current_source":
+            self._attr_native_value = state.source or "Unknown"
+        elif key == "mute_state":
+            self._attr_native_value = "Muted" if state.muted else "Unmuted"
+        elif key == "speaker_output":
+            self._attr_native_value = state.speaker_output or "Unknown"
+        elif key == "connection_status":
+            self._attr_native_value = "Connected" if state.available else "Disconnected"
+        elif key == "firmware_version":
+            self._attr_native_value = state.firmware_version or "Unknown"
+        elif key == "protocol_version":
             # We store model name now, not protocol version
-            self._attr_native_value = media_player.attributes.get("model", "Unknown")
\ No newline at end of file
+            self._attr_native_value = state.model or "Unknown"
+
+    @callback
+    def _async_media_player_updated(self, state: str, attributes: dict) -> None:
+        """Update from the media player's diagnostics, writing only if the value changed."""
+        previous = self._attr_native_value
+        self._update_value(state, attributes)
+        if self._attr_native_value != previous:
+            self.async_write_ha_state()
+
+    def _update_value(self, state: str, attributes: dict) -> None:
+        """Set the sensor value from the media player's diagnostics."""
+        if self.entity_description.key == "poll_interval":
+            self._attr_native_value = attributes.get("poll_interval")
+        elif self.entity_description.key == "io_queue_depth":
+            self._attr_native_value = attributes.get("io_queue_depth", 0)
+        elif self.entity_description.key in (
+            "bridge_connects",
+            "bridge_connect_ms",
+            "bridge_slot_hold_s",
+        ):
+            self._attr_native_value = attributes.get(self.entity_description.key)
\ No newline at end of file
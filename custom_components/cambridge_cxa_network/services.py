@@ -0,0 +1,184 @@
+"""Services for Cambridge CXA Network integration."""
+import asyncio
+import logging
+import time
+from typing import Any, Dict
+
+import voluptuous as vol
+
+from homeassistant.components.media_player import DOMAIN as MEDIA_PLAYER_DOMAIN
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.storage import Store
+
+from .const import (
+    DOMAIN,
+    SERVICE_GROUP_COMMAND,
+    SERVICE_SNAPSHOT,
+    SERVICE_RESTORE,
+    SERVICE_SEND_RAW,
+    SERVICE_PRECONNECT,
+    ATTR_ACTION,
+    ATTR_OPTION,
+    ATTR_PERSIST,
+    ATTR_COMMANDS,
+    RAW_COMMAND_PATTERN,
+    SNAPSHOT_STORAGE_KEY,
+    SNAPSHOT_STORAGE_VERSION,
+    GROUP_ACTIONS,
+    GROUP_ACTION_SELECT_SOURCE,
+    GROUP_ACTION_SELECT_SOUND_MODE,
+)
+from .media_player import CambridgeCXADevice
+
+_LOGGER = logging.getLogger(__name__)
+
+GROUP_COMMAND_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Required(ATTR_ACTION): vol.In(GROUP_ACTIONS),
+    vol.Optional(ATTR_OPTION): cv.string,
+})
+
+SNAPSHOT_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+    vol.Optional(ATTR_PERSIST, default=False): cv.boolean,
+})
+
+RESTORE_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+})
+
+SEND_RAW_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_id,
+    vol.Required(ATTR_COMMANDS): vol.All(
+        cv.ensure_list, [vol.All(cv.string, vol.Match(RAW_COMMAND_PATTERN))]
+    ),
+})
+
+
+PRECONNECT_SCHEMA = vol.Schema({
+    vol.Required(ATTR_ENTITY_ID): cv.entity_ids,
+})
+
+
+def _get_devices(hass: HomeAssistant, entity_ids) -> Dict[str, CambridgeCXADevice]:
+    """Resolve media player entity ids to our amplifier entities."""
+    component = hass.data.get(MEDIA_PLAYER_DOMAIN)
+    devices = {}
+    for entity_id in entity_ids:
+        entity = component.get_entity(entity_id) if component else None
+        if not isinstance(entity, CambridgeCXADevice):
+            raise HomeAssistantError(f"{entity_id} is not a Cambridge CXA amplifier")
+        devices[entity_id] = entity
+    return devices
+
+
+async def _timed_group_command(
+    device: CambridgeCXADevice, action: str, option: Any
+) -> Dict[str, Any]:
+    """Run a group action on one amp and report success and latency."""
+    start = time.monotonic()
+    try:
+        success = await device.async_group_command(action, option)
+        error = None
+    except Exception as e:
+        success = False
+        error = str(e)
+    result = {
+        "success": success,
+        "latency_ms": round((time.monotonic() - start) * 1000, 1),
+    }
+    if error:
+        result["error"] = error
+    return result
+
+
+async def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the integration services."""
+
+    async def async_group_command(call: ServiceCall) -> ServiceResponse:
+        """Send one action to many amplifiers concurrently."""
+        action = call.data[ATTR_ACTION]
+        option = call.data.get(ATTR_OPTION)
+        if action in (GROUP_ACTION_SELECT_SOURCE, GROUP_ACTION_SELECT_SOUND_MODE) and not option:
+            raise HomeAssistantError(f"Action {action} requires an option")
+
+        devices = _get_devices(hass, call.data[ATTR_ENTITY_ID])
+        # Every amp has its own connection and lock, so the writes go out in parallel
+        results = await asyncio.gather(*(
+            _timed_group_command(device, action, option)
+            for device in devices.values()
+        ))
+        _LOGGER.debug(f"group_command {action} finished on {len(results)} amps")
+        return {"results": dict(zip(devices, results))}
+
+    # Snapshots live in memory, keyed by entity id, and are mirrored to
+    # storage only when the caller asks for it
+    snapshots: Dict[str, dict] = {}
+    store = Store(hass, SNAPSHOT_STORAGE_VERSION, SNAPSHOT_STORAGE_KEY)
+    stored_loaded = False
+
+    async def async_snapshot(call: ServiceCall) -> ServiceResponse:
+        """Capture the current state of one or more amplifiers."""
+        devices = _get_devices(hass, call.data[ATTR_ENTITY_ID])
+        taken = {entity_id: device.snapshot() for entity_id, device in devices.items()}
+        snapshots.update(taken)
+
+        if call.data[ATTR_PERSIST]:
+            persisted = await store.async_load() or {}
+            persisted.update(taken)
+            await store.async_save(persisted)
+        return {"snapshots": taken}
+
+    async def async_restore(call: ServiceCall) -> ServiceResponse:
+        """Restore previously captured state, sending only what differs."""
+        nonlocal stored_loaded
+        devices = _get_devices(hass, call.data[ATTR_ENTITY_ID])
+
+        if not stored_loaded and any(entity_id not in snapshots for entity_id in devices):
+            # Fall back to snapshots persisted before a restart
+            for entity_id, snapshot in (await store.async_load() or {}).items():
+                snapshots.setdefault(entity_id, snapshot)
+            stored_loaded = True
+
+        missing = [entity_id for entity_id in devices if entity_id not in snapshots]
+        if missing:
+            raise HomeAssistantError(f"No snapshot for {', '.join(missing)}")
+
+        # Each amp gets its own pipelined commands, all amps in parallel
+        sent = await asyncio.gather(*(
+            device.async_restore(snapshots[entity_id])
+            for entity_id, device in devices.items()
+        ))
+        return {"commands": dict(zip(devices, sent))}
+
+    async def async_send_raw(call: ServiceCall) -> ServiceResponse:
+        """Send raw protocol commands in one transaction and return the replies."""
+        entity_id = call.data[ATTR_ENTITY_ID]
+        device = _get_devices(hass, [entity_id])[entity_id]
+        return {"replies": await device.async_send_raw(call.data[ATTR_COMMANDS])}
+
+    async def async_preconnect(call: ServiceCall) -> None:
+        """Open the connections to one or more amplifiers ahead of use."""
+        devices = _get_devices(hass, call.data[ATTR_ENTITY_ID])
+        await asyncio.gather(*(device.async_preconnect() for device in devices.values()))
+
+    services = [
+        (SERVICE_GROUP_COMMAND, async_group_command, GROUP_COMMAND_SCHEMA, SupportsResponse.OPTIONAL),
+        (SERVICE_SNAPSHOT, async_snapshot, SNAPSHOT_SCHEMA, SupportsResponse.OPTIONAL),
+        (SERVICE_RESTORE, async_restore, RESTORE_SCHEMA, SupportsResponse.OPTIONAL),
+        (SERVICE_SEND_RAW, async_send_raw, SEND_RAW_SCHEMA, SupportsResponse.ONLY),
+        (SERVICE_PRECONNECT, async_preconnect, PRECONNECT_SCHEMA, SupportsResponse.NONE),
+    ]
+    for service, handler, schema, supports_response in services:
+        if hass.services.has_service(DOMAIN, service):
+            continue
+        hass.services.async_register(
+            DOMAIN,
+            service,
+            handler,
+            schema=schema,
+            supports_response=supports_response,
+        )
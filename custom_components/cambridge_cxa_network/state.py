@@ -0,0 +1,109 @@
+"""Decoded state of a Cambridge CXA amplifier, with field-level change notifications."""
+import logging
+from dataclasses import dataclass, fields, replace
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .codec import FIELD_MUTE, FIELD_POWER, FIELD_SOURCE, Reply
+
+_LOGGER = logging.getLogger(__name__)
+
+# Field names, for subscribing
+STATE_AVAILABLE = "available"
+STATE_POWER = "power"
+STATE_SOURCE = "source"
+STATE_MUTED = "muted"
+STATE_SPEAKER_OUTPUT = "speaker_output"
+STATE_FIRMWARE_VERSION = "firmware_version"
+STATE_MODEL = "model"
+
+
+@dataclass(frozen=True, slots=True)
+class AmpState:
+    """Everything known about the amp, as decoded values; None means not known."""
+
+    available: bool = True
+    power: Optional[bool] = None
+    source: Optional[str] = None
+    muted: Optional[bool] = None
+    speaker_output: Optional[str] = None
+    firmware_version: Optional[str] = None
+    model: Optional[str] = None
+
+    def diff(self, other: "AmpState") -> FrozenSet[str]:
+        """Return the names of the fields whose values differ from other's."""
+        return frozenset(
+            name for name in _FIELD_NAMES if getattr(self, name) != getattr(other, name)
+        )
+
+
+_FIELD_NAMES = tuple(field.name for field in fields(AmpState))
+
+# Codec fields of the status replies -> the AmpState field each one reports
+_STATUS_FIELDS = {
+    FIELD_POWER: STATE_POWER,
+    FIELD_MUTE: STATE_MUTED,
+    FIELD_SOURCE: STATE_SOURCE,
+}
+
+
+def status_changes(reply: Optional[Reply]) -> Optional[Dict[str, Any]]:
+    """Return the AmpState changes a decoded status reply reports, or None if it is not one.
+
+    A source reply with an unknown code reports the source as None.
+    """
+    if reply is None:
+        return None
+    name = _STATUS_FIELDS.get(reply.field)
+    if name is None:
+        return None
+    return {name: reply.value}
+
+# Called with the new state and the names of the fields that changed
+Listener = Callable[[AmpState, FrozenSet[str]], None]
+
+
+class AmpStateTracker:
+    """Hold the current AmpState and notify listeners of the fields that change."""
+
+    def __init__(self, state: Optional[AmpState] = None):
+        """Initialize with a starting state and no listeners."""
+        self.state = state or AmpState()
+        self._listeners: List[Tuple[Listener, Optional[FrozenSet[str]]]] = []
+
+    def subscribe(
+        self, listener: Listener, fields: Optional[Iterable[str]] = None
+    ) -> Callable[[], None]:
+        """Call listener when any of fields changes, or any field if None.
+
+        Returns a function that unsubscribes it.
+        """
+        entry = (listener, frozenset(fields) if fields is not None else None)
+        self._listeners.append(entry)
+
+        def unsubscribe():
+            if entry in self._listeners:
+                self._listeners.remove(entry)
+
+        return unsubscribe
+
+    def update(self, **changes) -> FrozenSet[str]:
+        """Apply field changes and return the names of the ones that changed.
+
+        Listeners run synchronously, before this returns, and only if one
+        of their fields changed.
+        """
+        state = self.state
+        changed = frozenset(
+            name for name, value in changes.items() if getattr(state, name) != value
+        )
+        if not changed:
+            return changed
+        self.state = replace(state, **changes)
+        for listener, wanted in list(self._listeners):
+            if wanted is not None and wanted.isdisjoint(changed):
+                continue
+            try:
+                listener(self.state, changed)
+            except Exception:
+                _LOGGER.exception(f"Error notifying a listener of changes to {sorted(changed)}")
+        return changed
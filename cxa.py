@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+Talk to a Cambridge CXA from the command line; see --help.
+
+    ./cxa.py --host 10.0.0.24 query
+    ./cxa.py --host 10.0.0.24 set source D1
+    CXA_HOST=10.0.0.24 ./cxa.py ping -c 20
+"""
+
+import sys
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Control a Cambridge CXA without Home Assistant, over a local JSON-lines API.
+
+The daemon keeps the amp's state current with the integration's own
+connection, pacing, command journal and adaptive polling, and answers
+state queries from that cache. Keypads and scripts talk to it over TCP
+or a Unix socket, one JSON object per line:
+
+    ./cxa_daemon.py --host 10.0.0.24 --model CXA81
+    echo '{"id": 1, "op": "set", "field": "source", "value": "D1"}' | nc -q1 localhost 8897
+
+See custom_components/cambridge_cxa_network/daemon.py for the requests.
+"""
+
+import argparse
+import asyncio
+import logging
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.connection import SerialConnection, TCPSerialConnection
+from cambridge_cxa_network.const import (
+    AMP_TYPES,
+    DEFAULT_DAEMON_PORT,
+    DEFAULT_IDLE_TIMEOUT,
+    DEFAULT_JOURNAL_EXPIRY,
+    DEFAULT_PORT,
+)
+from cambridge_cxa_network.controller import AmpController
+from cambridge_cxa_network.daemon import AmpDaemon
+from cambridge_cxa_network.journal import CommandJournal
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=" ".join(__doc__.split("\n\n")[0].split()))
+    upstream = parser.add_mutually_exclusive_group(required=True)
+    upstream.add_argument("--host", help="USR-W610 address")
+    upstream.add_argument("--serial", help="serial port the amp is connected to")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="USR-W610 port")
+    parser.add_argument("--model", choices=AMP_TYPES, default="CXA81", help="amplifier model")
+    parser.add_argument(
+        "--listen", default=f"127.0.0.1:{DEFAULT_DAEMON_PORT}",
+        help="address:port to serve the API on, or 'none'",
+    )
+    parser.add_argument("--unix", help="also serve the API on this Unix socket")
+    parser.add_argument(
+        "--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT,
+        help="close the bridge connection after this many quiet seconds (0 = never)",
+    )
+    parser.add_argument(
+        "--journal-expiry", type=float, default=DEFAULT_JOURNAL_EXPIRY,
+        help="keep commands sent while the amp is unreachable this many seconds (0 = drop them)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every frame")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if args.host:
+        connection = TCPSerialConnection(args.host, args.port, args.idle_timeout)
+    else:
+        connection = SerialConnection(args.serial)
+    if args.journal_expiry:
+        connection.journal = CommandJournal(args.journal_expiry)
+    # Nothing is cached between runs, so learn the bridge's framing every start
+    await connection.probe_link()
+
+    daemon = AmpDaemon(AmpController(connection, args.model))
+    if args.listen == "none":
+        await daemon.start(host=None, unix_path=args.unix)
+    else:
+        host, _, port = args.listen.rpartition(":")
+        await daemon.start(host or "127.0.0.1", int(port), args.unix)
+    await daemon.serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Share one connection to a Cambridge CXA between Home Assistant and any
+number of local tools.
+
+The proxy holds the only connection to the USR-W610 (or the serial port)
+and listens on a local port that speaks the amp's own protocol. Point the
+integration, debug_connection.py or a plain `nc` at that port instead of
+the bridge and they no longer read each other's replies.
+
+    ./cxa_proxy.py --host 10.0.0.24
+    ./cxa_proxy.py --serial /dev/ttyUSB0 --listen 0.0.0.0:8898
+"""
+
+import argparse
+import asyncio
+import logging
+
+import standalone
+
+standalone.load_package()
+
+from cambridge_cxa_network.connection import SerialConnection, TCPSerialConnection
+from cambridge_cxa_network.const import DEFAULT_PORT, DEFAULT_PROXY_PORT
+from cambridge_cxa_network.proxy import MultiplexProxy
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=" ".join(__doc__.split("\n\n")[0].split()))
+    upstream = parser.add_mutually_exclusive_group(required=True)
+    upstream.add_argument("--host", help="USR-W610 address")
+    upstream.add_argument("--serial", help="serial port the amp is connected to")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="USR-W610 port")
+    parser.add_argument(
+        "--listen", default=f"127.0.0.1:{DEFAULT_PROXY_PORT}",
+        help="address:port to accept clients on",
+    )
+    parser.add_argument(
+        "--idle-timeout", type=float, default=0,
+        help="close the bridge connection after this many quiet seconds (0 = never, "
+             "which is needed to pass on frames the amp sends on its own)",
+    )
+    parser.add_argument("-v", "--verbose", action="store_true", help="log every frame")
+    return parser.parse_args()
+
+
+async def main():
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.INFO,
+        format="%(asctime)s %(levelname)s %(message)s",
+    )
+    if args.host:
+        upstream = TCPSerialConnection(args.host, args.port, args.idle_timeout)
+    else:
+        upstream = SerialConnection(args.serial)
+    host, _, port = args.listen.rpartition(":")
+    await MultiplexProxy(upstream, host or "127.0.0.1", int(port)).serve_forever()
+
+
+if __name__ == "__main__":
+    try:
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,28 @@
+"""Make the integration's package importable without Home Assistant.
+
+The command-line tools and benchmarks in this directory only use the
+protocol modules, which have no Home Assistant dependencies. Importing
+the package normally would run its __init__, which does. load_package()
+registers the package without running it, after which its modules import
+as usual:
+
+    import standalone
+    standalone.load_package()
+
+    from cambridge_cxa_network.connection import TCPSerialConnection
+"""
+import sys
+import types
+from pathlib import Path
+
+PACKAGE_NAME = "cambridge_cxa_network"
+PACKAGE_DIR = Path(__file__).parent / "custom_components" / PACKAGE_NAME
+
+
+def load_package():
+    """Register the package, skipping its Home Assistant __init__."""
+    if PACKAGE_NAME in sys.modules:
+        return
+    package = types.ModuleType(PACKAGE_NAME)
+    package.__path__ = [str(PACKAGE_DIR)]
+    sys.modules[PACKAGE_NAME] = package
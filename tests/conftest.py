@@ -0,0 +1,9 @@
+"""Shared setup for the protocol module tests, which run without Home Assistant."""
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import standalone  # noqa: E402
+
+standalone.load_package()
@@ -0,0 +1,125 @@
+"""Tests for the protocol codec."""
+import pytest
+
+from cambridge_cxa_network.codec import (
+    CXACodec,
+    FIELD_ERROR,
+    FIELD_FIRMWARE_VERSION,
+    FIELD_MUTE,
+    FIELD_POWER,
+    FIELD_SOUND_MODE,
+    FIELD_SOURCE,
+    Frame,
+    LINE_CACHE_SIZE,
+    encode_frame,
+    frame_kind,
+    parse_frame,
+)
+from cambridge_cxa_network.exceptions import (
+    CXADataError,
+    CXAGroupUnknownError,
+    CXANotAvailableError,
+    protocol_error,
+)
+
+
+@pytest.mark.parametrize(
+    "line, frame",
+    [
+        ("#02,01,1", Frame(2, 1, "1")),
+        ("#1,25,0", Frame(1, 25, "0")),
+        ("#13,02", Frame(13, 2)),
+        (" #14,02,1.23\r", Frame(14, 2, "1.23")),
+        ("#04,01,A,B", Frame(4, 1, "A,B")),
+        ("02,01,1", None),
+        ("#02", None),
+        ("#xx,01", None),
+    ],
+)
+def test_parse_frame(line, frame):
+    assert parse_frame(line) == frame
+
+
+def test_encode_frame_is_canonical():
+    assert encode_frame(parse_frame("#1,25,0")) == "#01,25,0"
+    assert encode_frame(Frame(13, 2)) == "#13,02"
+
+
+def test_frame_kind_accepts_reply_prefixes():
+    assert frame_kind("#04,01,") == (4, 1)
+    assert frame_kind("#1,12") == (1, 12)
+
+
+def test_encode():
+    codec = CXACodec("CXA81")
+    assert codec.encode(FIELD_POWER) == "#01,01"
+    assert codec.encode(FIELD_POWER, True) == "#01,11"
+    assert codec.encode(FIELD_MUTE, False) == "#01,04,0"
+    assert codec.encode(FIELD_SOURCE, "D1") == "#03,04,05"
+    # Sent verbatim, in the unpadded form the amp is known to take
+    assert codec.encode(FIELD_SOUND_MODE, "AB") == "#1,25,1"
+
+
+def test_encode_unknown_value_raises():
+    codec = CXACodec("CXA61")
+    with pytest.raises(ValueError):
+        codec.encode(FIELD_POWER, "on")
+    with pytest.raises(ValueError):
+        # Balanced input only exists on the CXA81
+        codec.encode(FIELD_SOURCE, "A1 Balanced")
+
+
+@pytest.mark.parametrize(
+    "line, field, value",
+    [
+        ("#02,01,1", FIELD_POWER, True),
+        ("#02,01,0", FIELD_POWER, False),
+        ("#02,03,1", FIELD_MUTE, True),
+        ("#04,01,05", FIELD_SOURCE, "D1"),
+        ("#4,1,05", FIELD_SOURCE, "D1"),
+        ("#04,01,99", FIELD_SOURCE, None),
+        ("#14,02,1.23", FIELD_FIRMWARE_VERSION, "1.23"),
+        ("#00,02", FIELD_ERROR, "#00,02"),
+        ("#0,4", FIELD_ERROR, "#00,04"),
+    ],
+)
+def test_decode(line, field, value):
+    reply = CXACodec("CXA81").decode(line)
+    assert (reply.field, reply.value) == (field, value)
+
+
+@pytest.mark.parametrize("line", [None, "", "garbage", "#99,99,1"])
+def test_decode_unknown(line):
+    assert CXACodec("CXA81").decode(line) is None
+
+
+def test_decode_cache_is_bounded():
+    codec = CXACodec("CXA81")
+    for version in range(1000):
+        assert codec.decode(f"#14,02,{version}").value == str(version)
+    assert len(codec._lines) <= codec._lines_precompiled + LINE_CACHE_SIZE
+
+
+@pytest.mark.parametrize(
+    "reply, error",
+    [
+        ("#00,01", CXAGroupUnknownError),
+        ("#00,03\r", CXADataError),
+        ("#0,4", CXANotAvailableError),
+    ],
+)
+def test_protocol_error(reply, error):
+    exception = protocol_error("#01,99", reply)
+    assert type(exception) is error
+    assert exception.command == "#01,99"
+    assert exception.reply == reply.strip()
+
+
+def test_retryable_error_is_not_permanent():
+    assert protocol_error("#03,04,05", "#00,04").permanent is False
+    assert protocol_error("#13,01", "#00,02").permanent is True
+
+
+@pytest.mark.parametrize("reply", [None, "", "#02,01,1", "not a frame"])
+def test_protocol_error_ignores_other_replies(reply):
+    assert protocol_error("#01,01", reply) is None
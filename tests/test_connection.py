@@ -0,0 +1,176 @@
+"""Tests for transactions over a TCP connection to a fake amp."""
+import asyncio
+from typing import Dict, List
+
+from cambridge_cxa_network.connection import TCPSerialConnection
+
+
+class FakeAmp:
+    """A local TCP server that answers commands like the amp would.
+
+    replies maps a command to the replies it gets, in turn; the last one
+    is repeated. Commands without replies are not answered.
+    """
+
+    def __init__(self, replies: Dict[str, List[str]], delay: float = 0.0):
+        self.replies = {command: list(answers) for command, answers in replies.items()}
+        self.delay = delay
+        self.received: List[str] = []
+        self._server = None
+        self._clients: Dict[asyncio.StreamWriter, asyncio.Task] = {}
+
+    async def start(self) -> TCPSerialConnection:
+        """Start listening and return a connection to it."""
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return TCPSerialConnection("127.0.0.1", self._server.sockets[0].getsockname()[1], 0)
+
+    async def stop(self):
+        """Stop listening and wait for the connections to end."""
+        self._server.close()
+        for writer in self._clients:
+            writer.close()
+        await asyncio.gather(*self._clients.values())
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._clients[writer] = asyncio.current_task()
+        try:
+            while True:
+                command = (await reader.readuntil(b"\r")).decode().strip()
+                self.received.append(command)
+                answers = self.replies.get(command)
+                if not answers:
+                    continue
+                reply = answers.pop(0) if len(answers) > 1 else answers[0]
+                await asyncio.sleep(self.delay)
+                writer.write(reply.encode() + b"\r")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+
+
+def run(amp: FakeAmp, test):
+    """Run test(connection) against amp, closing everything afterwards."""
+
+    async def main():
+        connection = await amp.start()
+        try:
+            return await test(connection)
+        finally:
+            await connection.close()
+            await amp.stop()
+
+    return asyncio.run(main())
+
+
+def test_replies_are_matched_to_their_commands():
+    amp = FakeAmp({"#01,01": ["#02,01,1"], "#03,01": ["#04,01,05"]})
+
+    async def test(connection):
+        return await connection.transaction(["#01,01", "#03,01"])
+
+    results = run(amp, test)
+    assert [reply for reply, _ in results] == ["#02,01,1", "#04,01,05"]
+    assert amp.received == ["#01,01", "#03,01"]
+
+
+def test_missing_reply_times_out():
+    amp = FakeAmp({"#01,01": ["#02,01,1"]})
+
+    async def test(connection):
+        return await connection.transaction(["#01,01", "#13,02"], timeout=0.2)
+
+    results = run(amp, test)
+    assert [reply for reply, _ in results] == ["#02,01,1", None]
+    assert results[1][1] >= 0.2
+
+
+def test_cancelled_transaction_reply_is_not_taken_for_the_next():
+    # The amp answers the first query with standby and every later one with on
+    amp = FakeAmp({"#01,01": ["#02,01,0", "#02,01,1"]}, delay=0.1)
+    unsolicited = []
+
+    async def test(connection):
+        connection.unsolicited_handler = unsolicited.append
+        task = asyncio.ensure_future(connection.transaction(["#01,01"]))
+        await asyncio.sleep(0.03)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        assert task.cancelled()
+        return await connection.transaction(["#01,01"])
+
+    results = run(amp, test)
+    assert results[0][0] == "#02,01,1"
+    assert unsolicited == ["#02,01,0"]
+
+
+def test_cancelled_transaction_releases_the_lock():
+    amp = FakeAmp({"#01,01": ["#02,01,1"]}, delay=0.05)
+
+    async def test(connection):
+        task = asyncio.ensure_future(connection.transaction(["#01,01", "#01,01"]))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        return await asyncio.wait_for(connection.transaction(["#01,01"]), 2)
+
+    assert run(amp, test)[0][0] == "#02,01,1"
+
+
+def test_unanswered_commands_are_sent_without_waiting():
+    amp = FakeAmp({"#01,01": ["#02,01,1"]})
+
+    async def test(connection):
+        return await connection.transaction(["#1,25,1", "#01,01"])
+
+    results = run(amp, test)
+    assert results[0] == (None, 0.0)
+    assert results[1][0] == "#02,01,1"
+    # Well within the reply deadline the speaker command would otherwise have
+    assert results[1][1] < 0.5
+    assert amp.received == ["#1,25,1", "#01,01"]
+
+
+def test_only_unanswered_commands_are_still_sent():
+    amp = FakeAmp({})
+
+    async def test(connection):
+        results = await connection.transaction(["#1,25,2"])
+        # Written by the time the transaction returns, not necessarily received
+        await asyncio.sleep(0.1)
+        return results
+
+    assert run(amp, test) == [(None, 0.0)]
+    assert amp.received == ["#1,25,2"]
+
+
+def test_concurrent_writes_are_all_sent_in_order():
+    amp = FakeAmp({})
+
+    async def test(connection):
+        await connection.preconnect()
+        sent = await asyncio.gather(
+            connection.write("#01,04,1\r"), connection.write("#03,04,05\r")
+        )
+        await asyncio.sleep(0.1)
+        return sent
+
+    assert run(amp, test) == [True, True]
+    assert amp.received == ["#01,04,1", "#03,04,05"]
+
+
+def test_cancelled_write_is_not_sent_by_the_next_writer():
+    amp = FakeAmp({})
+
+    async def test(connection):
+        await connection.preconnect()
+        async with connection._lock:
+            task = asyncio.ensure_future(connection.write("#01,04,1\r"))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        sent = await connection.write("#03,04,05\r")
+        await asyncio.sleep(0.1)
+        return sent
+
+    assert run(amp, test) is True
+    assert amp.received == ["#03,04,05"]
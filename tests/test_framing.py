@@ -0,0 +1,108 @@
+"""Tests for line framing."""
+from cambridge_cxa_network.framing import LineFramer
+
+
+def frames(framer):
+    """Return every complete frame buffered."""
+    result = []
+    while (frame := framer.next_frame()) is not None:
+        result.append(frame)
+    return result
+
+
+def test_frames_across_terminators():
+    framer = LineFramer()
+    framer.feed(b"#02,01,1\r#02,03,0\r\n#04,01,05\n")
+    assert frames(framer) == ["#02,01,1", "#02,03,0", "#04,01,05"]
+    assert len(framer) == 0
+
+
+def test_partial_frame_waits_for_its_terminator():
+    framer = LineFramer()
+    framer.feed(b"#02,01,1\r#04,0")
+    assert frames(framer) == ["#02,01,1"]
+    assert len(framer) == 5
+    framer.feed(b"1,0")
+    assert framer.next_frame() is None
+    framer.feed(b"5\r")
+    assert frames(framer) == ["#04,01,05"]
+
+
+def test_partial_frame_survives_buffer_wrap():
+    framer = LineFramer(size=16)
+    framer.feed(b"#02,01,1\r#04,01")
+    assert frames(framer) == ["#02,01,1"]
+    # No room left at the end, so the partial frame moves to the front
+    framer.feed(b",05\r#02,03,1\r")
+    assert frames(framer) == ["#04,01,05", "#02,03,1"]
+
+
+def test_buffer_grows_for_frames_not_yet_taken():
+    framer = LineFramer(size=16)
+    framer.feed(b"#02,01,1\r" * 5)
+    assert frames(framer) == ["#02,01,1"] * 5
+
+
+def test_unterminated_noise_is_dropped():
+    framer = LineFramer(size=16)
+    framer.feed(b"x" * 16)
+    framer.feed(b"#02,01,1\r")
+    assert frames(framer) == ["#02,01,1"]
+
+
+def test_recv_into_interface():
+    framer = LineFramer()
+    data = b"#14,02,1.23\r"
+    buffer = framer.get_buffer()
+    buffer[:len(data)] = data
+    framer.buffer_updated(len(data))
+    assert frames(framer) == ["#14,02,1.23"]
+
+
+def test_echoes_are_stripped():
+    framer = LineFramer()
+    framer.strip_echoes = True
+    framer.expect_echo("#01,01")
+    framer.expect_echo("#03,01")
+    framer.feed(b"#01,01\r#02,01,1\r#03,01\r#04,01,05\r")
+    assert frames(framer) == ["#02,01,1", "#04,01,05"]
+
+
+def test_echo_split_across_reads():
+    framer = LineFramer()
+    framer.strip_echoes = True
+    framer.expect_echo("#01,01")
+    framer.feed(b"#01,")
+    assert framer.next_frame() is None
+    framer.feed(b"01\r#02,0")
+    assert framer.next_frame() is None
+    framer.feed(b"1,1\r")
+    assert frames(framer) == ["#02,01,1"]
+
+
+def test_lost_echo_is_forgotten():
+    framer = LineFramer()
+    framer.strip_echoes = True
+    framer.expect_echo("#01,01")
+    framer.expect_echo("#03,01")
+    # The first echo never came; the second one takes it off the list
+    framer.feed(b"#03,01\r#04,01,05\r#01,01\r")
+    assert frames(framer) == ["#04,01,05", "#01,01"]
+
+
+def test_echoes_kept_without_strip_echoes():
+    framer = LineFramer()
+    framer.expect_echo("#01,01")
+    framer.feed(b"#01,01\r#02,01,1\r")
+    assert frames(framer) == ["#01,01", "#02,01,1"]
+
+
+def test_clear_forgets_expected_echoes():
+    framer = LineFramer()
+    framer.strip_echoes = True
+    framer.expect_echo("#01,01")
+    framer.feed(b"#02,0")
+    framer.clear()
+    assert len(framer) == 0
+    framer.feed(b"#01,01\r")
+    assert frames(framer) == ["#01,01"]